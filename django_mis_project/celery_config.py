@@ -4,12 +4,23 @@ Fixed circular import issues with proper naming
 """
 
 import os
+import zlib
 from celery import Celery
+from celery.schedules import crontab
 from django.conf import settings
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_mis_project.settings')
 
+# Workers started with ``-P gevent`` (notifications/maintenance/analytics) must
+# make psycopg2 cooperative, otherwise every DB wait blocks the whole hub.
+if os.environ.get('CELERY_WORKER_POOL') == 'gevent':
+    try:
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+    except ImportError:
+        pass
+
 # Create celery app with proper naming to avoid circular imports
 app = Celery('django_mis_project')
 
@@ -21,57 +32,91 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
 # Configure beat schedule
+# Cron-aligned so restarts don't re-anchor intervals; the daily/weekly jobs
+# are staggered across off-peak hours instead of firing together.
 app.conf.beat_schedule = {
     'monitor-connection-health': {
         'task': 'mis_app.tasks.monitor_connection_health',
-        'schedule': 300.0,  # Every 5 minutes
+        'schedule': crontab(minute='*/5'),  # Every 5 minutes
     },
     'send-daily-digest': {
         'task': 'mis_app.tasks.send_daily_digest',
-        'schedule': 86400.0,  # Daily at midnight
+        'schedule': crontab(hour=1, minute=30),  # Daily 01:30
         'options': {'queue': 'notifications'}
     },
     'cleanup-old-data': {
         'task': 'mis_app.tasks.cleanup_old_data',
-        'schedule': 604800.0,  # Weekly
+        'schedule': crontab(day_of_week='sun', hour=2, minute=0),  # Weekly, Sun 02:00
         'options': {'queue': 'maintenance'}
     },
     'generate-performance-insights': {
         'task': 'mis_app.tasks.generate_performance_insights',
-        'schedule': 604800.0,  # Weekly
+        'schedule': crontab(day_of_week='sun', hour=4, minute=0),  # Weekly, Sun 04:00
         'options': {'queue': 'analytics'}
     },
 }
 
-# Task routing configuration
-app.conf.task_routes = {
+# Data processing is sharded into data_processing.0 .. data_processing.(N-1) so that
+# every task for the same upload/session lands on the same worker and reuses its
+# in-process caches (parsed files, template lookups).
+DATA_PROCESSING_SHARDS = int(os.environ.get('CELERY_DATA_PROCESSING_SHARDS', '4'))
+
+
+# Static task -> queue table. Worker pool noted per queue.
+TASK_QUEUES = {
     # Report tasks
-    'mis_app.tasks.execute_scheduled_report': {'queue': 'reports'},
-    
+    'mis_app.tasks.execute_scheduled_report': 'reports',  # prefork
+
     # Dashboard tasks
-    'mis_app.tasks.refresh_dashboard_data': {'queue': 'dashboards'},
-    
-    # Data processing tasks
-    'mis_app.tasks.process_data_upload': {'queue': 'data_processing'},
-    'mis_app.tasks.detect_data_anomalies': {'queue': 'analytics'},
-    
+    'mis_app.tasks.refresh_dashboard_data': 'dashboards',  # prefork
+
+    # Data processing tasks (process_data_upload is sharded in route_task; prefork)
+    'mis_app.tasks.detect_data_anomalies': 'analytics',  # gevent
+
     # Notification tasks
-    'mis_app.tasks.send_daily_digest': {'queue': 'notifications'},
-    
+    'mis_app.tasks.send_daily_digest': 'notifications',  # gevent
+
     # Maintenance tasks
-    'mis_app.tasks.cleanup_old_data': {'queue': 'maintenance'},
-    'mis_app.tasks.monitor_connection_health': {'queue': 'maintenance'},
-    
+    'mis_app.tasks.cleanup_old_data': 'maintenance',  # gevent
+    'mis_app.tasks.monitor_connection_health': 'maintenance',  # gevent
+
     # Analytics tasks
-    'mis_app.tasks.generate_performance_insights': {'queue': 'analytics'},
+    'mis_app.tasks.generate_performance_insights': 'analytics',  # gevent
 }
 
+
+def route_task(name, args, kwargs, options, task=None, **kw):
+    """
+    Single router for every publish: one dict lookup, plus a stable shard for
+    process_data_upload keyed by its session/upload id.
+    """
+    if name == 'mis_app.tasks.process_data_upload':
+        kwargs = kwargs or {}
+        key = kwargs.get('session_id') or kwargs.get('upload_id')
+        if key is None and args:
+            key = args[0]
+        shard = zlib.crc32(str(key).encode('utf-8')) % DATA_PROCESSING_SHARDS if key is not None else 0
+        return {'queue': f'data_processing.{shard}'}
+    queue = TASK_QUEUES.get(name)
+    return {'queue': queue} if queue else None
+
+
+# Task routing configuration
+app.conf.task_routes = (route_task,)
+
 # Task configuration
 app.conf.update(
     # Serialization
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # msgpack is binary and smaller/faster than json; json stays accepted so
+    # messages queued before the switch still decode. Task args and results
+    # must be plain Python types (ids, str, int, float, dict, list).
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
+
+    # Compression (zstd is registered by kombu when ``zstandard`` is installed)
+    task_compression='zstd',
     
     # Time settings
     timezone=settings.TIME_ZONE if hasattr(settings, 'TIME_ZONE') else 'UTC',
@@ -83,15 +128,34 @@ app.conf.update(
     task_soft_time_limit=25 * 60,  # 25 minutes soft limit
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+
+    # Broker transport
+    # With late acks on Redis a message is redelivered once it has been
+    # unacked for visibility_timeout; keep that well above the hard time
+    # limit so long data_processing tasks are never run twice.
+    broker_transport_options={
+        'visibility_timeout': 2 * 60 * 60,  # 2 hours
+        'socket_keepalive': True,
+        'health_check_interval': 30,
+    },
+    # Publishers (gunicorn workers) share a pooled broker connection instead of
+    # opening a new one per .delay(); size it to roughly workers * threads.
+    broker_pool_limit=int(os.environ.get('CELERY_BROKER_POOL_LIMIT', '50')),
+    broker_connection_timeout=4,
+    broker_connection_max_retries=3,
     
     # Worker settings
-    worker_prefetch_multiplier=1,
+    # Prefetch is set per worker group on the command line (see docker-compose.yml):
+    # short I/O-bound queues prefetch 64, long data_processing/reports stay at 1.
     worker_max_tasks_per_child=1000,
     worker_disable_rate_limits=False,
     
     # Result backend settings
-    result_expires=3600,  # 1 hour
-    result_compression='gzip',
+    # Only tasks whose result is actually read keep one; see task_annotations below.
+    result_expires=300,  # 5 minutes
+    result_extended=False,
+    result_compression='zstd',
+    task_store_eager_result=False,
     
     # Queue settings
     task_default_queue='default',
@@ -104,6 +168,16 @@ app.conf.update(
     task_send_sent_event=True,
 )
 
+# Fire-and-forget tasks: nobody reads their return value, so skip the backend write.
+app.conf.task_annotations = {
+    'mis_app.tasks.monitor_connection_health': {'ignore_result': True},
+    'mis_app.tasks.send_daily_digest': {'ignore_result': True},
+    'mis_app.tasks.cleanup_old_data': {'ignore_result': True},
+    'mis_app.tasks.refresh_dashboard_data': {'ignore_result': True},
+    'mis_app.tasks.detect_data_anomalies': {'ignore_result': True},
+    'mis_app.tasks.generate_performance_insights': {'ignore_result': True},
+}
+
 # Queue definitions
 app.conf.task_create_missing_queues = True
 
@@ -112,15 +186,17 @@ from celery import Task
 
 class DatabaseTask(Task):
     """
-    Custom task base class that ensures database connections
-    are properly closed after task execution
+    Custom task base class that recycles database connections around task
+    execution. Healthy connections are reused across tasks (CONN_MAX_AGE);
+    only unusable or expired ones are closed.
     """
     def __call__(self, *args, **kwargs):
+        from django.db import close_old_connections
+        close_old_connections()
         try:
             return self.run(*args, **kwargs)
         finally:
-            from django.db import connection
-            connection.close()
+            close_old_connections()
 
 # Set default task base class
 app.Task = DatabaseTask
@@ -210,7 +286,7 @@ def health_check(self):
     }
 
 # Periodic task to clean up expired results
-@app.task
+@app.task(ignore_result=True)
 def cleanup_expired_results():
     """Clean up expired task results"""
     try:
@@ -100,6 +100,11 @@ else:
                 'PASSWORD': os.environ.get('DB_PASSWORD', ''),
                 'HOST': os.environ.get('DB_HOST', 'localhost'),
                 'PORT': os.environ.get('DB_PORT', '5432'),
+                # Keep connections open across requests/Celery tasks; stale ones are health-checked
+                'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '600')),
+                'CONN_HEALTH_CHECKS': True,
+                # Required when running behind pgbouncer (transaction mode) or RDS Proxy
+                'DISABLE_SERVER_SIDE_CURSORS': os.environ.get('DB_POOLER', 'False').lower() == 'true',
             }
         }
 
@@ -233,9 +238,9 @@ DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@misapp.com')
 # Celery Configuration (for background tasks)
 CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
-CELERY_ACCEPT_CONTENT = ['json']
-CELERY_TASK_SERIALIZER = 'json'
-CELERY_RESULT_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['msgpack', 'json']
+CELERY_TASK_SERIALIZER = 'msgpack'
+CELERY_RESULT_SERIALIZER = 'msgpack'
 CELERY_TIMEZONE = TIME_ZONE
 
 # Cache Configuration
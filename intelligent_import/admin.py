@@ -1,22 +1,27 @@
 from django.contrib import admin
-from .models import ReportTemplate, ReportTemplateHeader, PendingMaster, UnitAlias
+from .models import ReportTemplate, ReportTemplateExtras, ReportTemplateHeader, PendingMaster, Alias
 
 class ReportTemplateHeaderInline(admin.TabularInline):
     model = ReportTemplateHeader
     extra = 0
 
+class ReportTemplateExtrasInline(admin.StackedInline):
+    model = ReportTemplateExtras
+    extra = 0
+
 @admin.register(ReportTemplate)
 class ReportTemplateAdmin(admin.ModelAdmin):
     list_display = ("name", "version", "is_active", "ownership_type", "updated_at")
     search_fields = ("name",)
-    inlines = [ReportTemplateHeaderInline]
+    inlines = [ReportTemplateHeaderInline, ReportTemplateExtrasInline]
 
 @admin.register(PendingMaster)
 class PendingMasterAdmin(admin.ModelAdmin):
     list_display = ("entity", "status", "created_at")
     list_filter = ("entity", "status")
 
-@admin.register(UnitAlias)
-class UnitAliasAdmin(admin.ModelAdmin):
-    list_display = ("unit_name_alias", "unit_code")
-    search_fields = ("unit_name_alias", "unit_code")
+@admin.register(Alias)
+class AliasAdmin(admin.ModelAdmin):
+    list_display = ("entity", "alias", "canonical_code")
+    list_filter = ("entity",)
+    search_fields = ("alias", "canonical_code")
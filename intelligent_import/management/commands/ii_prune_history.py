@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from intelligent_import.models import DataLineage, ImportAuditLog, SystemConfiguration
+
+
+def _delete_in_batches(qs, batch_size: int) -> int:
+    """Delete qs in pk batches so each statement stays short and locks little."""
+    total = 0
+    while True:
+        pks = list(qs.values_list("pk", flat=True)[:batch_size])
+        if not pks:
+            return total
+        deleted, _ = qs.model.objects.filter(pk__in=pks).delete()
+        total += deleted
+
+
+class Command(BaseCommand):
+    help = (
+        "Prune lineage and audit rows past the SystemConfiguration retention windows "
+        "(retain_sessions_days / retain_audit_logs_years)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", dest="batch_size", type=int, default=5000)
+        parser.add_argument("--dry-run", action="store_true", help="Only report row counts")
+
+    def handle(self, *args, **options):
+        config = SystemConfiguration.get_config()
+        batch_size = options["batch_size"]
+        now = timezone.now()
+
+        lineage_qs = DataLineage.objects.filter(
+            import_session__created_at__lt=now - timedelta(days=config.retain_sessions_days)
+        )
+        audit_qs = ImportAuditLog.objects.filter(
+            created_at__lt=now - timedelta(days=365 * config.retain_audit_logs_years)
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(f"lineage rows: {lineage_qs.count()}, audit rows: {audit_qs.count()}")
+            return
+
+        lineage_deleted = _delete_in_batches(lineage_qs, batch_size)
+        audit_deleted = _delete_in_batches(audit_qs, batch_size)
+        self.stdout.write(f"Deleted {lineage_deleted} lineage rows and {audit_deleted} audit rows.")
@@ -1,12 +1,14 @@
 from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
 from django.utils import timezone
-import json
 import os
 
+import orjson
+
 from django.conf import settings
 
 from intelligent_import.models import ImportSession, ReportTemplate
-from intelligent_import.services.data_processing import process_and_validate_data
+from intelligent_import.services.data_processing import DESTINATION_SCOPE, process_and_validate_data
 
 
 def _infer_target_table(template: ReportTemplate | None) -> str:
@@ -15,20 +17,62 @@ def _infer_target_table(template: ReportTemplate | None) -> str:
         return ""
     if getattr(template, "target_table", ""):
         return template.target_table
-    try:
-        headers = list(template.headers.all())
-    except Exception:
-        headers = []
-    tbls = [getattr(h, "target_table", "") for h in headers if getattr(h, "target_table", "")]
-    if not tbls:
-        return ""
-    fact_tbls = [t for t in tbls if t.startswith("fact_")]
-    pool = fact_tbls or tbls
-    # most common
-    best = {}
-    for t in pool:
-        best[t] = best.get(t, 0) + 1
-    return sorted(best.items(), key=lambda x: x[1], reverse=True)[0][0]
+    # most common header target_table (prefer fact_ tables), counted in SQL
+    counts = (
+        template.headers.exclude(target_table="")
+        .values("target_table")
+        .annotate(n=Count("id"))
+        .order_by("-n", "target_table")
+    )
+    row = counts.filter(target_table__startswith="fact_").first() or counts.first()
+    return row["target_table"] if row else ""
+
+
+def _dumps(payload) -> str:
+    return orjson.dumps(
+        payload,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        default=str,
+    ).decode()
+
+
+# Validated but not yet imported; once a session imports, its file is in the destination
+VALIDATED_STATUSES = ("data_validated", "pending_approval")
+
+
+def _prior_validation(session: ImportSession) -> ImportSession | None:
+    """Most recent other session of the same user that validated the same file with the same mapping."""
+    if not session.file_hash:
+        return None
+    prior = (
+        ImportSession.objects.filter(
+            user_id=session.user_id,
+            file_hash=session.file_hash,
+            connection_id=session.connection_id,
+            target_table=session.target_table,
+            status__in=VALIDATED_STATUSES,
+        )
+        .exclude(id=session.id)
+        .order_by("-updated_at")
+        .first()
+    )
+    if prior and prior.column_mapping == session.column_mapping and prior.validation_results:
+        return prior
+    return None
+
+
+def _file_only_results(results: dict) -> dict:
+    """Keep the parse/schema issues of stored results; destination-dependent checks are dropped."""
+    errors = [e for e in results.get("errors") or [] if e.get("scope") != DESTINATION_SCOPE]
+    warnings = [w for w in results.get("warnings") or [] if w.get("scope") != DESTINATION_SCOPE]
+    return {
+        "errors": errors,
+        "warnings": warnings,
+        "total_errors": len(errors),
+        "total_warnings": len(warnings),
+        "exact_duplicates": results.get("exact_duplicates"),
+        "destination_checks": "not run; use --no-reuse to validate against the destination",
+    }
 
 
 class Command(BaseCommand):
@@ -37,6 +81,10 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("--session", dest="session_id", help="ImportSession UUID", default=None)
         parser.add_argument("--limit", dest="limit", type=int, default=10, help="Preview rows to show")
+        parser.add_argument(
+            "--no-reuse", dest="reuse", action="store_false",
+            help="Always re-validate instead of reusing a prior session's file checks",
+        )
 
     def handle(self, *args, **options):
         session_id = options.get("session_id")
@@ -53,18 +101,22 @@ class Command(BaseCommand):
                 raise CommandError("No ImportSession rows found.")
 
         if not session.target_table:
-            tpl = None
-            if getattr(session, "report_template_id", None):
-                tpl = ReportTemplate.objects.filter(id=session.report_template_id).prefetch_related("headers").first()
-            inferred = _infer_target_table(tpl)
+            inferred = _infer_target_table(session.report_template) if session.report_template_id else ""
             if inferred:
+                # plain UPDATE keeps the UI consistent without save() signal dispatch
+                now = timezone.now()
+                ImportSession.objects.filter(pk=session.pk).update(target_table=inferred, updated_at=now)
                 session.target_table = inferred
-                session.save(update_fields=["target_table", "updated_at"])  # keep for UI consistency
+                session.updated_at = now
 
         temp_path = os.path.join(
             settings.MEDIA_ROOT, "intelligent_import_temp", session.temp_filename or ""
         )
-        if not session.temp_filename or not os.path.exists(temp_path):
+        try:
+            if not session.temp_filename:
+                raise FileNotFoundError(temp_path)
+            os.stat(temp_path)
+        except OSError:
             raise CommandError(
                 "Temporary file missing for this session. Please re-upload or restart analysis."
             )
@@ -72,15 +124,29 @@ class Command(BaseCommand):
         if not session.column_mapping:
             raise CommandError("Column mapping is empty for this session.")
 
+        prior = _prior_validation(session) if options.get("reuse", True) else None
+        if prior is not None:
+            preview = dict(prior.preview_data or {})
+            preview["sample_data"] = (preview.get("sample_data") or [])[:limit]
+            results = _file_only_results(prior.validation_results or {})
+            payload = {
+                "validation_results": results,
+                "preview_data": preview,
+                "summary": {
+                    "total_rows": preview.get("total_rows", 0),
+                    "error_rows": results.get("total_errors", 0),
+                },
+                "reused_session": str(prior.id),
+            }
+            self.stdout.write(_dumps(payload))
+            return
+
         try:
-            payload = process_and_validate_data(session, temp_path, session.column_mapping)
+            payload = process_and_validate_data(
+                session, temp_path, session.column_mapping, preview_limit=limit
+            )
         except Exception as exc:
             raise CommandError(f"Validation raised: {exc}")
 
-        # Optionally trim preview size for readability
-        preview = payload.get("preview_data", {}).get("sample_data", [])
-        if isinstance(preview, list) and len(preview) > limit:
-            payload["preview_data"]["sample_data"] = preview[:limit]
-
-        self.stdout.write(json.dumps(payload, ensure_ascii=False, indent=2))
+        self.stdout.write(_dumps(payload))
 
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0008_importsession_import_mode_importsession_target_table'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='reporttemplateheader',
+            name='target_table',
+            field=models.CharField(blank=True, db_index=True, max_length=255),
+        ),
+    ]
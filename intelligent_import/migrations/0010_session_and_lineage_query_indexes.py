@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0009_reporttemplateheader_target_table_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='datalineage',
+            name='intelligent_is_roll_375ece_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='importsession',
+            name='intelligent_created_7d1328_idx',
+        ),
+        migrations.AddIndex(
+            model_name='datalineage',
+            index=models.Index(condition=models.Q(('is_rolled_back', False)), fields=['import_session', 'target_table'], name='ii_lineage_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importsession',
+            index=models.Index(fields=['user', 'status', '-created_at'], name='ii_sess_user_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='importsession',
+            index=models.Index(fields=['file_hash', 'status'], name='ii_sess_hash_status_idx'),
+        ),
+    ]
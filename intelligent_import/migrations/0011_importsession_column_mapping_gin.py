@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    # jsonb containment lookups on column_mapping; Postgres only
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS ii_sess_colmap_gin "
+        "ON intelligent_import_sessions USING GIN (column_mapping jsonb_path_ops)"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS ii_sess_colmap_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intelligent_import", "0010_session_and_lineage_query_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
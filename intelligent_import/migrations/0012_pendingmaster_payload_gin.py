@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    # jsonb containment lookups on PendingMaster.payload; Postgres only
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS ii_pending_payload_gin "
+        "ON intelligent_import_pendingmaster USING GIN (payload jsonb_path_ops)"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS ii_pending_payload_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intelligent_import", "0011_importsession_column_mapping_gin"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:14
+
+from django.db import migrations, models
+
+
+def backfill_analysis_scalars(apps, schema_editor):
+    ImportSession = apps.get_model('intelligent_import', 'ImportSession')
+    batch = []
+    for session in ImportSession.objects.only('id', 'analysis_summary').iterator(chunk_size=500):
+        summary = session.analysis_summary or {}
+        file_analysis = summary.get('file_analysis') or {}
+        session.total_columns = int(file_analysis.get('total_columns') or 0)
+        session.confidence_score = float(summary.get('confidence_score') or 0.0)
+        batch.append(session)
+        if len(batch) >= 500:
+            ImportSession.objects.bulk_update(batch, ['total_columns', 'confidence_score'])
+            batch = []
+    if batch:
+        ImportSession.objects.bulk_update(batch, ['total_columns', 'confidence_score'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0012_pendingmaster_payload_gin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importsession',
+            name='confidence_score',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name='importsession',
+            name='total_columns',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_analysis_scalars, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0013_importsession_analysis_scalars'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='importsession',
+            name='intelligent_user_id_b847e7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='importsession',
+            name='intelligent_file_ha_f65ad6_idx',
+        ),
+        migrations.AddIndex(
+            model_name='datalineage',
+            index=models.Index(fields=['import_session', 'source_row_number'], name='ii_lineage_sess_row'),
+        ),
+        migrations.AddIndex(
+            model_name='importsession',
+            index=models.Index(fields=['user', '-created_at'], name='ii_sess_user_ct'),
+        ),
+        migrations.AddIndex(
+            model_name='importsession',
+            index=models.Index(fields=['connection', 'status', '-created_at'], name='ii_sess_conn_status_ct'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:17
+
+from django.db import migrations, models
+
+
+def strip_metadata_suffix(apps, schema_editor):
+    # "<content>_<md5 of metadata>" -> "<content>"
+    ImportSession = apps.get_model('intelligent_import', 'ImportSession')
+    batch = []
+    for session in ImportSession.objects.filter(file_hash__contains='_').only('id', 'file_hash').iterator(chunk_size=500):
+        session.file_hash = session.file_hash.split('_', 1)[0][:64]
+        batch.append(session)
+        if len(batch) >= 500:
+            ImportSession.objects.bulk_update(batch, ['file_hash'])
+            batch = []
+    if batch:
+        ImportSession.objects.bulk_update(batch, ['file_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0014_session_lineage_order_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(strip_metadata_suffix, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='importsession',
+            name='file_hash',
+            field=models.CharField(blank=True, help_text='File content hash (hex digest)', max_length=64),
+        ),
+    ]
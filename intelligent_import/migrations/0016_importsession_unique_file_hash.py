@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:18
+
+from django.db import migrations, models
+
+INACTIVE_STATUSES = ('failed', 'cancelled', 'rolled_back')
+
+
+def release_older_duplicates(apps, schema_editor):
+    # Keep the hash on the newest active session per (user, connection, file_hash)
+    ImportSession = apps.get_model('intelligent_import', 'ImportSession')
+    active = ImportSession.objects.exclude(file_hash='').exclude(status__in=INACTIVE_STATUSES)
+    dupes = (
+        active.values('user_id', 'connection_id', 'file_hash')
+        .annotate(n=models.Count('id'))
+        .filter(n__gt=1)
+    )
+    for group in dupes:
+        ids = list(
+            active.filter(
+                user_id=group['user_id'],
+                connection_id=group['connection_id'],
+                file_hash=group['file_hash'],
+            ).order_by('-created_at').values_list('id', flat=True)
+        )
+        ImportSession.objects.filter(id__in=ids[1:]).update(file_hash='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0015_importsession_file_hash_digest'),
+    ]
+
+    operations = [
+        migrations.RunPython(release_older_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='importsession',
+            constraint=models.UniqueConstraint(condition=models.Q(models.Q(('file_hash', ''), _negated=True), models.Q(('status__in', ['failed', 'cancelled', 'rolled_back']), _negated=True)), fields=('user', 'connection', 'file_hash'), name='uniq_sess_userhash'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:19
+
+from django.db import migrations, models
+import uuid
+
+
+def copy_unit_aliases(apps, schema_editor):
+    UnitAlias = apps.get_model('intelligent_import', 'UnitAlias')
+    Alias = apps.get_model('intelligent_import', 'Alias')
+    seen = set()
+    rows = []
+    for ua in UnitAlias.objects.all().order_by('unit_name_alias'):
+        folded = " ".join(str(ua.unit_name_alias or "").split()).casefold()
+        if folded in seen:  # old table was case-sensitive; keep the first spelling
+            continue
+        seen.add(folded)
+        rows.append(Alias(id=ua.id, entity='units', alias=ua.unit_name_alias, alias_ci=folded, canonical_code=ua.unit_code))
+    Alias.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0016_importsession_unique_file_hash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Alias',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('entity', models.CharField(choices=[('units', 'Units'), ('buyers', 'Buyers'), ('styles', 'Styles'), ('lines', 'Lines'), ('vendors', 'Vendors'), ('colors', 'Colors'), ('airports', 'Airports')], max_length=32)),
+                ('alias', models.CharField(max_length=255)),
+                ('alias_ci', models.CharField(editable=False, max_length=255)),
+                ('canonical_code', models.CharField(max_length=64)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='alias',
+            index=models.Index(fields=['entity', 'canonical_code'], name='ii_alias_ent_code'),
+        ),
+        migrations.RunPython(copy_unit_aliases, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='alias',
+            constraint=models.UniqueConstraint(fields=('entity', 'alias_ci'), name='u_alias_ent_ci'),
+        ),
+        migrations.DeleteModel(
+            name='UnitAlias',
+        ),
+    ]
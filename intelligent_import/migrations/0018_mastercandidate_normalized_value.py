@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:21
+
+from django.db import migrations, models
+
+
+def backfill_normalized(apps, schema_editor):
+    """Fill proposed_value_normalized; later duplicates in a session/table keep '' (outside the constraint)."""
+    MasterDataCandidate = apps.get_model('intelligent_import', 'MasterDataCandidate')
+    seen = set()
+    batch = []
+    for cand in MasterDataCandidate.objects.order_by('created_at', 'pk').iterator():
+        norm = " ".join(str(cand.proposed_value or "").split()).casefold()
+        key = (cand.import_session_id, cand.target_master_table, norm)
+        if not norm or key in seen:
+            continue
+        seen.add(key)
+        cand.proposed_value_normalized = norm
+        batch.append(cand)
+        if len(batch) >= 1000:
+            MasterDataCandidate.objects.bulk_update(batch, ['proposed_value_normalized'])
+            batch = []
+    if batch:
+        MasterDataCandidate.objects.bulk_update(batch, ['proposed_value_normalized'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0017_alias_replaces_unitalias'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='masterdatacandidate',
+            name='proposed_value_normalized',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_normalized, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='masterdatacandidate',
+            constraint=models.UniqueConstraint(condition=models.Q(('proposed_value_normalized', ''), _negated=True), fields=('import_session', 'target_master_table', 'proposed_value_normalized'), name='u_mdc_sess_tbl_norm'),
+        ),
+    ]
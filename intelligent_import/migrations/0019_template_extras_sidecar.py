@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def copy_schema_proposals(apps, schema_editor):
+    ReportTemplate = apps.get_model('intelligent_import', 'ReportTemplate')
+    ReportTemplateExtras = apps.get_model('intelligent_import', 'ReportTemplateExtras')
+    ReportTemplateExtras.objects.bulk_create([
+        ReportTemplateExtras(template_id=pk, schema_proposals=proposals)
+        for pk, proposals in ReportTemplate.objects.values_list('pk', 'schema_proposals')
+        if proposals
+    ])
+
+
+def restore_schema_proposals(apps, schema_editor):
+    ReportTemplate = apps.get_model('intelligent_import', 'ReportTemplate')
+    ReportTemplateExtras = apps.get_model('intelligent_import', 'ReportTemplateExtras')
+    for extras in ReportTemplateExtras.objects.all():
+        ReportTemplate.objects.filter(pk=extras.template_id).update(schema_proposals=extras.schema_proposals)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0018_mastercandidate_normalized_value'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportTemplateExtras',
+            fields=[
+                ('template', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='extras', serialize=False, to='intelligent_import.reporttemplate')),
+                ('schema_proposals', models.JSONField(blank=True, default=list)),
+            ],
+        ),
+        migrations.RunPython(copy_schema_proposals, restore_schema_proposals),
+        migrations.RemoveField(
+            model_name='importsession',
+            name='master_data_suggestions',
+        ),
+        migrations.RemoveField(
+            model_name='reporttemplate',
+            name='schema_proposals',
+        ),
+        migrations.RemoveField(
+            model_name='reporttemplateheader',
+            name='depends_on',
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:25
+
+from django.db import migrations, models
+
+
+def collapse_to_single_row(apps, schema_editor):
+    """Keep the most recently updated row and move it to pk=1."""
+    SystemConfiguration = apps.get_model('intelligent_import', 'SystemConfiguration')
+    keep = SystemConfiguration.objects.order_by('-updated_at', '-pk').first()
+    if keep is None:
+        return
+    SystemConfiguration.objects.exclude(pk=keep.pk).delete()
+    if keep.pk != 1:
+        SystemConfiguration.objects.filter(pk=keep.pk).update(id=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0019_template_extras_sidecar'),
+    ]
+
+    operations = [
+        migrations.RunPython(collapse_to_single_row, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='systemconfiguration',
+            name='id',
+            field=models.PositiveSmallIntegerField(default=1, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AddConstraint(
+            model_name='systemconfiguration',
+            constraint=models.CheckConstraint(check=models.Q(('id', 1)), name='sysconf_singleton'),
+        ),
+    ]
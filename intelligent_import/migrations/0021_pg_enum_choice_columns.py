@@ -0,0 +1,58 @@
+from django.db import migrations
+
+# (table, column, varchar length, enum type, labels) -- frozen copy of the model choices.
+# Adding a choice later needs "ALTER TYPE <type> ADD VALUE '<label>'" in its own migration.
+ENUM_COLUMNS = [
+    (
+        "intelligent_import_sessions", "status", 20, "ii_session_status_e",
+        ("file_uploaded", "analyzing", "template_suggested", "mapping_defined",
+         "mapping_approved", "data_validated", "pending_approval", "approved",
+         "importing_data", "completed", "failed", "cancelled", "rolled_back"),
+    ),
+    (
+        "intelligent_import_master_data_candidates", "status", 20, "ii_candidate_status_e",
+        ("pending", "approved", "rejected"),
+    ),
+    (
+        "intelligent_import_audit_log", "action", 20, "ii_audit_action_e",
+        ("data_insert", "data_update", "master_data_create", "import_rollback"),
+    ),
+    (
+        "intelligent_import_data_lineage", "operation", 10, "ii_lineage_operation_e",
+        ("insert", "update", "skip", "error"),
+    ),
+]
+
+
+def to_enum(apps, schema_editor):
+    # Postgres only: 4-byte enum values instead of varchar in rows and indexes
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column, _, enum_type, labels in ENUM_COLUMNS:
+        values = ", ".join(schema_editor.quote_value(label) for label in labels)
+        schema_editor.execute(f"CREATE TYPE {enum_type} AS ENUM ({values})")
+        schema_editor.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {enum_type} "
+            f"USING {column}::text::{enum_type}"
+        )
+
+
+def to_varchar(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column, length, enum_type, _ in ENUM_COLUMNS:
+        schema_editor.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar({length}) USING {column}::text"
+        )
+        schema_editor.execute(f"DROP TYPE IF EXISTS {enum_type}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intelligent_import", "0020_systemconfiguration_singleton"),
+    ]
+
+    operations = [
+        migrations.RunPython(to_enum, to_varchar),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+LINEAGE_JSON_COLUMNS = ("original_data", "transformed_data")
+
+
+def _lz4_available(schema_editor):
+    # Column compression is PG14+, and lz4 only if the server was built with it
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql" or connection.pg_version < 140000:
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_settings "
+            "WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)"
+        )
+        return cursor.fetchone() is not None
+
+
+def set_compression(method):
+    def apply(apps, schema_editor):
+        if not _lz4_available(schema_editor):
+            return
+        # Only affects newly written values; existing rows keep pglz until rewritten
+        for column in LINEAGE_JSON_COLUMNS:
+            schema_editor.execute(
+                f"ALTER TABLE intelligent_import_data_lineage ALTER COLUMN {column} SET COMPRESSION {method}"
+            )
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intelligent_import", "0021_pg_enum_choice_columns"),
+    ]
+
+    operations = [
+        migrations.RunPython(set_compression("lz4"), set_compression("pglz")),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-16 07:28
+
+from django.db import migrations
+
+
+def create_created_at_indexes(apps, schema_editor):
+    # Audit/lineage rows are append-only, so created_at follows physical order
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS ii_audit_ct_brin ON intelligent_import_audit_log "
+            "USING BRIN (created_at) WITH (pages_per_range = 128)"
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS ii_lineage_ct_brin ON intelligent_import_data_lineage "
+            "USING BRIN (created_at) WITH (pages_per_range = 128)"
+        )
+    else:
+        schema_editor.execute("CREATE INDEX ii_audit_ct_idx ON intelligent_import_audit_log (created_at)")
+
+
+def drop_created_at_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS ii_audit_ct_brin")
+        schema_editor.execute("DROP INDEX IF EXISTS ii_lineage_ct_brin")
+    elif vendor == "mysql":
+        schema_editor.execute("DROP INDEX ii_audit_ct_idx ON intelligent_import_audit_log")
+    else:
+        schema_editor.execute("DROP INDEX IF EXISTS ii_audit_ct_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('intelligent_import', '0022_lineage_lz4_compression'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='importauditlog',
+            name='intelligent_created_29b6e7_idx',
+        ),
+        migrations.RunPython(create_created_at_indexes, drop_created_at_indexes),
+    ]
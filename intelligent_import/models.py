@@ -6,11 +6,15 @@ Separate from existing MIS models to avoid conflicts
 
 import uuid
 import json
-import hashlib
-from django.db import models
+import time
+from django.core.cache import cache
+from django.db import connections, models
+from django.db.models.expressions import RawSQL
 from django.utils import timezone
 from django.core.validators import RegexValidator
 from mis_app.models import User, ExternalConnection
+
+import blake3
 from django.conf import settings
 from django.db.models import JSONField
 
@@ -38,20 +42,41 @@ class ReportTemplate(models.Model):
     # NEW: header -> mapping rows
     mapping = models.JSONField(default=dict, blank=True)
 
-    # NEW: schema proposals (accumulate until approved)
-    schema_proposals = models.JSONField(default=list, blank=True)
-
     # audit
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name="rt_created")
     updated_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name="rt_updated")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    def save(self, *args, **kwargs):
+        # Any edit of an existing template (views or admin, incl. header inlines) is a new version
+        if not self._state.adding:
+            self.version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "version" not in update_fields:
+                kwargs["update_fields"] = [*update_fields, "version"]
+        super().save(*args, **kwargs)
+
+    def get_extras(self):
+        """Sidecar row for this template (unsaved if none exists yet)."""
+        try:
+            return self.extras
+        except ReportTemplateExtras.DoesNotExist:
+            return ReportTemplateExtras(template=self)
+
+
+class ReportTemplateExtras(models.Model):
+    """Rarely-read template blobs, kept off the main table; load with select_related('extras')."""
+    template = models.OneToOneField(ReportTemplate, on_delete=models.CASCADE, primary_key=True, related_name="extras")
+
+    # schema proposals (accumulate until approved)
+    schema_proposals = models.JSONField(default=list, blank=True)
+
 class ReportTemplateHeader(models.Model):
     id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
     template = models.ForeignKey(ReportTemplate, on_delete=models.CASCADE, related_name="headers")
     source_header = models.CharField(max_length=255)                    # exactly as it appears in file
-    target_table = models.CharField(max_length=255, blank=True)         # e.g. fact_sewing_production
+    target_table = models.CharField(max_length=255, blank=True, db_index=True)  # e.g. fact_sewing_production
     target_column = models.CharField(max_length=255, blank=True)        # e.g. production_qty
     data_type = models.CharField(max_length=64, blank=True)             # text, int, number, date
     is_required = models.BooleanField(default=False)
@@ -61,7 +86,6 @@ class ReportTemplateHeader(models.Model):
     master_data_source = models.CharField(max_length=64, blank=True)    # "units", "buyers", "styles", ...
     master_output_field = models.CharField(max_length=64, blank=True)   # e.g. "unit_code"
     strict = models.BooleanField(default=False)                         # you chose auto-create pending => False
-    depends_on = models.JSONField(default=list, blank=True)  # keep but we’ll avoid using it
 
     transform = models.CharField(max_length=128, blank=True)            # e.g., "trim|upper", "date:%Y-%m-%d"
 
@@ -87,12 +111,50 @@ class PendingMaster(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
-# --- ALIAS (minimal, only Units to start; extend similarly for Buyers/Styles later) ---
+def casefold_value(value):
+    """Case/whitespace-insensitive key for master data values ("  Acme  LTD" -> "acme ltd")."""
+    return " ".join(("" if value is None else str(value)).split()).casefold()
 
-class UnitAlias(models.Model):
+
+# --- ALIAS (one table for every master entity; a new entity is rows, not a migration) ---
+
+class Alias(models.Model):
     id = models.UUIDField(primary_key=True, editable=False, default=uuid.uuid4)
-    unit_name_alias = models.CharField(max_length=255, unique=True)
-    unit_code = models.CharField(max_length=64)  # canonical code
+    entity = models.CharField(max_length=32, choices=PendingMaster.ENTITY_CHOICES)
+    alias = models.CharField(max_length=255)                            # as entered
+    alias_ci = models.CharField(max_length=255, editable=False)         # casefolded, for index-backed lookups
+    canonical_code = models.CharField(max_length=64)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["entity", "alias_ci"], name="u_alias_ent_ci"),
+        ]
+        indexes = [
+            models.Index(fields=["entity", "canonical_code"], name="ii_alias_ent_code"),
+        ]
+
+    @staticmethod
+    def fold(value):
+        return casefold_value(value)
+
+    def save(self, *args, **kwargs):
+        self.alias_ci = self.fold(self.alias)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def resolve(cls, entity, value):
+        """Canonical code for an alias of the given entity, or None."""
+        return (
+            cls.objects.filter(entity=entity, alias_ci=cls.fold(value))
+            .values_list("canonical_code", flat=True)
+            .first()
+        )
+
+
+class ImportSessionManager(models.Manager):
+    """Joins the to-one relations every session listing touches."""
+    def get_queryset(self):
+        return super().get_queryset().select_related('user', 'connection', 'report_template', 'approved_by')
 
 
 class ImportSession(models.Model):
@@ -125,7 +187,7 @@ class ImportSession(models.Model):
     original_filename = models.CharField(max_length=255)
     temp_filename = models.CharField(max_length=255, blank=True)
     file_size = models.BigIntegerField(help_text="File size in bytes")
-    file_hash = models.CharField(max_length=128, blank=True, help_text="File content hash")
+    file_hash = models.CharField(max_length=64, blank=True, help_text="File content hash (hex digest)")
     
     # Template and mapping
     report_template = models.ForeignKey(ReportTemplate, on_delete=models.SET_NULL, null=True, blank=True)
@@ -134,9 +196,13 @@ class ImportSession(models.Model):
     target_table = models.CharField(max_length=255, blank=True)
     
     # Session state
+    # Postgres: native ENUM (migration 0021); new choices need ALTER TYPE ... ADD VALUE
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='file_uploaded')
     header_row = models.IntegerField(default=0)
     total_rows = models.IntegerField(default=0)
+    # Scalars copied out of analysis_summary so lists don't need the JSON blob
+    total_columns = models.IntegerField(default=0)
+    confidence_score = models.FloatField(default=0.0)
     
     # Analysis and mapping details
     analysis_summary = models.JSONField(default=dict, help_text="Key results from the file analyzer")
@@ -146,9 +212,6 @@ class ImportSession(models.Model):
     validation_results = models.JSONField(default=dict, help_text="Data validation results")
     preview_data = models.JSONField(default=dict, help_text="Sample processed data for preview")
     
-    # Master data handling
-    master_data_suggestions = models.JSONField(default=dict, help_text="Suggested new master data")
-    
     # Approval workflow
     approved_by = models.ForeignKey(
         User, on_delete=models.SET_NULL, null=True, blank=True, 
@@ -173,38 +236,91 @@ class ImportSession(models.Model):
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
+    objects = ImportSessionManager()
+
+    # Sessions in these states no longer block re-uploading the same file
+    INACTIVE_STATUSES = ('failed', 'cancelled', 'rolled_back')
+
+    # Large JSON blobs only needed on the session detail/preview screens
+    HEAVY_FIELDS = ('analysis_summary', 'validation_results', 'preview_data')
+
     class Meta:
         db_table = 'intelligent_import_sessions'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user', 'status']),
-            models.Index(fields=['file_hash']),
-            models.Index(fields=['created_at']),
+            # "my recent sessions" (optionally by status) and hash-dedupe lookups;
+            # these also cover the old (user, status) and (file_hash) prefixes
+            models.Index(fields=['user', '-created_at'], name='ii_sess_user_ct'),
+            models.Index(fields=['user', 'status', '-created_at'], name='ii_sess_user_recent_idx'),
+            models.Index(fields=['connection', 'status', '-created_at'], name='ii_sess_conn_status_ct'),
+            models.Index(fields=['file_hash', 'status'], name='ii_sess_hash_status_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'connection', 'file_hash'],
+                condition=~models.Q(file_hash='') & ~models.Q(status__in=['failed', 'cancelled', 'rolled_back']),
+                name='uniq_sess_userhash',
+            ),
         ]
     
     def __str__(self):
         return f"{self.original_filename} - {self.status}"
     
+    @classmethod
+    def active_duplicates(cls, user, connection, file_hash):
+        """Sessions that hold the (user, connection, file_hash) uniqueness slot."""
+        return cls.objects.filter(
+            user=user, connection=connection, file_hash=file_hash
+        ).exclude(status__in=cls.INACTIVE_STATUSES).defer(*cls.HEAVY_FIELDS).order_by('-created_at')
+
     def add_system_note(self, message, level='info'):
         """Add timestamped system note"""
-        note = {
-            'timestamp': timezone.now().isoformat(),
-            'level': level,
-            'message': message
-        }
-        self.system_notes.append(note)
-        self.save(update_fields=['system_notes', 'updated_at'])
-    
-    def generate_file_hash(self, file_content):
-        """Generate hash for deduplication"""
-        content_hash = hashlib.sha256(file_content).hexdigest()
-        metadata = {
-            'filename': self.original_filename,
-            'user_id': str(self.user.id),
-            'connection_id': str(self.connection.id)
-        }
-        metadata_hash = hashlib.md5(json.dumps(metadata, sort_keys=True).encode()).hexdigest()
-        return f"{content_hash}_{metadata_hash}"
+        self.add_system_notes([message], level=level)
+
+    def add_system_notes(self, messages, level='info'):
+        """
+        Append several timestamped notes with a single UPDATE. On PostgreSQL
+        the append happens server-side (jsonb ||), so the existing list is
+        neither re-sent nor overwritten by concurrent writers.
+        """
+        now = timezone.now()
+        notes = [
+            {'timestamp': now.isoformat(), 'level': level, 'message': message}
+            for message in messages
+        ]
+        if not notes:
+            return
+        self.system_notes.extend(notes)
+        if connections[self._state.db or 'default'].vendor == 'postgresql':
+            value = RawSQL("COALESCE(system_notes, '[]'::jsonb) || %s::jsonb", [json.dumps(notes)])
+        else:
+            value = self.system_notes
+        ImportSession.objects.filter(pk=self.pk).update(system_notes=value, updated_at=now)
+        self.updated_at = now
+    
+    @staticmethod
+    def content_hasher():
+        """Incremental hasher for file content (multithreaded BLAKE3); stored file_hash values depend on it"""
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+
+    def generate_file_hash(self, file_content=None, content_hash=None):
+        """
+        Generate hash for deduplication from raw bytes, a file-like object
+        (read in 1 MiB chunks) or a precomputed content digest.
+        """
+        if content_hash is None:
+            hasher = self.content_hasher()
+            if isinstance(file_content, (bytes, bytearray, memoryview)):
+                hasher.update(file_content)
+            elif hasattr(file_content, 'chunks'):  # Django UploadedFile
+                for chunk in file_content.chunks(chunk_size=1 << 20):
+                    hasher.update(chunk)
+            else:
+                for chunk in iter(lambda: file_content.read(1 << 20), b''):
+                    hasher.update(chunk)
+            content_hash = hasher.hexdigest()
+        # Content digest only; scope by user/connection/filename in the query when needed
+        return content_hash
 
 
 class MasterDataCandidate(models.Model):
@@ -221,6 +337,9 @@ class MasterDataCandidate(models.Model):
     import_session = models.ForeignKey(ImportSession, on_delete=models.CASCADE, related_name='master_data_candidates')
     target_master_table = models.CharField(max_length=100, help_text="e.g., mis_app_buyer")
     proposed_value = models.CharField(max_length=255, help_text="The new value from the file (e.g., a new buyer name)")
+    # casefold_value(proposed_value); set explicitly when using bulk_create
+    proposed_value_normalized = models.CharField(max_length=255, editable=False, default='')
+    # Postgres: native ENUM (migration 0021); new choices need ALTER TYPE ... ADD VALUE
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     
     # Approval details
@@ -238,11 +357,27 @@ class MasterDataCandidate(models.Model):
             models.Index(fields=['import_session', 'status']),
             models.Index(fields=['target_master_table']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['import_session', 'target_master_table', 'proposed_value_normalized'],
+                condition=~models.Q(proposed_value_normalized=''),
+                name='u_mdc_sess_tbl_norm',
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.proposed_value_normalized = casefold_value(self.proposed_value)
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"'{self.proposed_value}' for {self.target_master_table} ({self.status})"
 
 
+class ImportAuditLogManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().select_related('executed_by', 'approved_by')
+
+
 class ImportAuditLog(models.Model):
     """
     Audit log for all actions during the intelligent import process.
@@ -261,6 +396,7 @@ class ImportAuditLog(models.Model):
     report_template = models.ForeignKey(ReportTemplate, on_delete=models.SET_NULL, null=True, blank=True)
     
     # Action details
+    # Postgres: native ENUM (migration 0021); new choices need ALTER TYPE ... ADD VALUE
     action = models.CharField(max_length=20, choices=ACTION_CHOICES)
     table_name = models.CharField(max_length=100)
     
@@ -282,6 +418,8 @@ class ImportAuditLog(models.Model):
     
     # Audit fields
     created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = ImportAuditLogManager()
     
     class Meta:
         db_table = 'intelligent_import_audit_log'
@@ -289,7 +427,7 @@ class ImportAuditLog(models.Model):
         indexes = [
             models.Index(fields=['import_session', 'action']),
             models.Index(fields=['table_name']),
-            models.Index(fields=['created_at']),
+            # created_at is indexed in migration 0023 (BRIN on Postgres, B-tree elsewhere)
         ]
     
     def __str__(self):
@@ -298,7 +436,8 @@ class ImportAuditLog(models.Model):
 
 class DataLineage(models.Model):
     """
-    Track lineage of imported data for audit and rollback
+    Track lineage of imported data for audit and rollback.
+    One row per source row: write with bulk_create, not per-row create().
     """
     OPERATION_CHOICES = [
         ('insert', 'Insert'),
@@ -322,6 +461,7 @@ class DataLineage(models.Model):
     transformed_data = models.JSONField(help_text="Final data inserted")
     
     # Operation details
+    # Postgres: native ENUM (migration 0021); new choices need ALTER TYPE ... ADD VALUE
     operation = models.CharField(max_length=10, choices=OPERATION_CHOICES, default='insert')
     
     # Rollback information
@@ -339,7 +479,13 @@ class DataLineage(models.Model):
         indexes = [
             models.Index(fields=['import_session', 'target_table']),
             models.Index(fields=['target_table', 'target_record_id']),
-            models.Index(fields=['is_rolled_back']),
+            models.Index(fields=['import_session', 'source_row_number'], name='ii_lineage_sess_row'),
+            # live (not rolled back) lineage rows per session/table
+            models.Index(
+                fields=['import_session', 'target_table'],
+                condition=models.Q(is_rolled_back=False),
+                name='ii_lineage_live_idx',
+            ),
         ]
     
     def __str__(self):
@@ -348,8 +494,10 @@ class DataLineage(models.Model):
 
 class SystemConfiguration(models.Model):
     """
-    System-wide configuration for intelligent import
+    System-wide configuration for intelligent import (single row, pk=1)
     """
+    id = models.PositiveSmallIntegerField(primary_key=True, default=1, editable=False)
+
     # File processing settings
     max_file_size_mb = models.IntegerField(default=100)
     chunk_size = models.IntegerField(default=1000)
@@ -384,18 +532,50 @@ class SystemConfiguration(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     updated_by = models.ForeignKey(User, on_delete=models.CASCADE)
     
+    CACHE_KEY = 'ii:sysconf'
+    CACHE_TTL = 60  # seconds (shared cache, bounds cross-process staleness)
+    LOCAL_TTL = 5  # seconds (per-process copy, skips the cache round trip)
+
     class Meta:
         db_table = 'intelligent_import_system_config'
+        constraints = [
+            models.CheckConstraint(check=models.Q(id=1), name='sysconf_singleton'),
+        ]
     
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.clear_cache()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self.clear_cache()
+        return result
+
+    @classmethod
+    def clear_cache(cls):
+        _SYSCONF_LOCAL['config'] = None
+        cache.delete(cls.CACHE_KEY)
+
     @classmethod
     def get_config(cls):
-        """Get system configuration, creating default if not exists"""
-        try:
-            return cls.objects.get()
-        except cls.DoesNotExist:
-            return cls.objects.create(
-                updated_by_id=1  # Assume admin user with ID 1
+        """Get system configuration (cached briefly), creating default if not exists"""
+        now = time.monotonic()
+        config = _SYSCONF_LOCAL['config']
+        if config is not None and now < _SYSCONF_LOCAL['expires']:
+            return config
+        config = cache.get(cls.CACHE_KEY)
+        if config is None:
+            config, _ = cls.objects.get_or_create(
+                pk=1,
+                defaults={'updated_by_id': 1},  # Assume admin user with ID 1
             )
+            cache.set(cls.CACHE_KEY, config, cls.CACHE_TTL)
+        _SYSCONF_LOCAL.update(config=config, expires=now + cls.LOCAL_TTL)
+        return config
+
+
+# Per-process copy of the SystemConfiguration row (see get_config)
+_SYSCONF_LOCAL = {'config': None, 'expires': 0.0}
 
 
 # Data type choices for schema definition
@@ -1,15 +1,24 @@
 import re
 import unicodedata
+from functools import lru_cache
 
 # Reserved words list (Postgres short set)
-RESERVED = {"user","order","group","select","where","table","column","count","limit","offset"}
+RESERVED = frozenset({"user","order","group","select","where","table","column","count","limit","offset"})
 
+# Template builder prefixes like new/newcol/newtable with or without underscores
+_PREFIX_RE = re.compile(r"^(?:__?reuse_new__?:|__?new(?:col|table)?__?:|new(?:col|table)?:)\s*", re.IGNORECASE)
+_MULTI_US = re.compile(r"_+")
+# Every ASCII char other than [a-z0-9] -> "_" (input is already ASCII-folded and lowercased)
+_TRANS = str.maketrans({c: "_" for c in map(chr, range(128)) if not ("a" <= c <= "z" or "0" <= c <= "9")})
+
+# The helpers below are pure functions of their (immutable) arguments and run
+# per header on every import, so they are memoized; use .cache_clear() in tests.
+@lru_cache(maxsize=4096)
 def normalize_snake(s: str, maxlen=60):
     s = unicodedata.normalize("NFKD", s or "").encode("ascii", "ignore").decode("ascii")
-    s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    s = re.sub(r"^[0-9_]+", "", s)           # strip leading digits/underscores
+    s = s.strip().lower().translate(_TRANS)
+    s = _MULTI_US.sub("_", s).strip("_")
+    s = s.lstrip("0123456789_")              # strip leading digits/underscores
     if not s:
         s = "x"
     if s in RESERVED:
@@ -22,6 +31,7 @@ def table_name(role: str, label: str):
     base = f"{role}_{topic}" if topic else f"{role}_x"
     return base[:63]  # PG limit
 
+@lru_cache(maxsize=4096)
 def resolve_template_table_name(value: str) -> str:
     """Resolve a template-provided table value into a safe SQL identifier.
 
@@ -29,10 +39,10 @@ def resolve_template_table_name(value: str) -> str:
     - Normalizes to snake_case and enforces length/character rules.
     """
     v = (value or "").strip()
-    # Strip various template builder prefixes like new/newcol/newtable with or without underscores
-    v = re.sub(r"^(?:__?reuse_new__?:|__?new(?:col|table)?__?:|new(?:col|table)?:)\s*", "", v, flags=re.IGNORECASE)
+    v = _PREFIX_RE.sub("", v)
     return normalize_snake(v, maxlen=63)
 
+@lru_cache(maxsize=4096)
 def resolve_template_column_name(value: str) -> str:
     """Resolve a template-provided column value into a safe SQL identifier.
 
@@ -40,6 +50,5 @@ def resolve_template_column_name(value: str) -> str:
     - Normalizes to snake_case and enforces length/character rules.
     """
     v = (value or "").strip()
-    # Strip various template builder prefixes like new/newcol/newtable with or without underscores
-    v = re.sub(r"^(?:__?reuse_new__?:|__?new(?:col|table)?__?:|new(?:col|table)?:)\s*", "", v, flags=re.IGNORECASE)
+    v = _PREFIX_RE.sub("", v)
     return normalize_snake(v, maxlen=63)
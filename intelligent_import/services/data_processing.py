@@ -12,64 +12,227 @@ schemas.  It performs three main responsibilities:
 
 from __future__ import annotations
 
-import hashlib
 import json
 import re
 
 NULL_EQUIV = {"", "na", "n/a", "null", "none", None}
+# Same tokens as NULL_EQUIV, matched case-insensitively in one pass (no lowered copy per cell)
+_NULL_RE = re.compile(r"\s*(?:na|n/a|null|none)?\s*$", re.IGNORECASE)
 
-def _canon_cell(v):
-    if v is None:
-        return None
-    s = str(v).strip()
-    if s.lower() in NULL_EQUIV:
-        return None
-    # collapse inner spaces for fairness
-    s = " ".join(s.split())
-    return s
+def _canonical_hashes(col):
+    """uint64 per cell of its trimmed, space-collapsed text; null-equivalent tokens hash alike.
 
-def _row_hash(row, columns):
-    vals = [ _canon_cell(row.get(c)) for c in columns ]
-    # serialize with type fidelity (None -> null)
-    blob = json.dumps(vals, separators=(',', ':'), ensure_ascii=False)
-    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+    Only distinct values go through the string ops; cells pick up their hash via factorize codes.
+    """
+    codes, uniques = pd.factorize(col)
+    text = pd.Series(list(uniques) + [None], dtype=object)  # code -1 (NA) -> last slot
+    text = text.astype(str).str.strip().str.replace(r"\s+", " ", regex=True)
+    text = text.mask(text.str.match(_NULL_RE))
+    return pd.util.hash_pandas_object(text, index=False).to_numpy()[codes]
 
 def find_exact_duplicates(rows, columns, max_samples=3):
     """
-    rows: list of dicts / or DataFrame.to_dict(orient='records')
+    rows: DataFrame (or list of dicts)
     columns: list[str] to consider (ignore calculated/ignored)
     Returns: {"duplicate_groups":[{hash,count,sample_idx:[...]}], "duplicates_total": N }
     """
-    bucket = {}
-    for i, r in enumerate(rows):
-        h = _row_hash(r, columns)
-        g = bucket.setdefault(h, {"count": 0, "sample_idx": []})
-        g["count"] += 1
-        if len(g["sample_idx"]) < max_samples:
-            g["sample_idx"].append(i+1)  # 1-based for UI
-    groups = [{"hash": h, "count": g["count"], "sample_idx": g["sample_idx"]} for h, g in bucket.items() if g["count"] > 1]
-    total = sum(g["count"]-1 for g in bucket.values() if g["count"] > 1)
+    df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+    columns = [c for c in columns if c in df.columns]
+    if not columns or df.empty:
+        return {"duplicate_groups": [], "duplicates_total": 0}
+
+    cell_hashes = pd.DataFrame({c: _canonical_hashes(df[c]) for c in columns})
+    # Compare the per-cell hashes column by column; a single row hash could collide
+    dup_mask = cell_hashes.duplicated(keep=False).to_numpy()
+    if not dup_mask.any():
+        return {"duplicate_groups": [], "duplicates_total": 0}
+
+    dup_cells = cell_hashes[dup_mask]
+    positions = np.flatnonzero(dup_mask) + 1  # 1-based for UI
+    row_hashes = pd.util.hash_pandas_object(dup_cells, index=False).to_numpy()
+    groups = [
+        {"hash": format(row_hashes[idx[0]], "016x"), "count": len(idx), "sample_idx": positions[idx[:max_samples]].tolist()}
+        for idx in dup_cells.groupby(list(dup_cells.columns), sort=False).indices.values()
+    ]
+    total = int(dup_mask.sum()) - len(groups)
     return {"duplicate_groups": groups, "duplicates_total": total}
 
+import csv
 import io
 import logging
 import math
 import os
+import threading
 import time
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
+import numpy as np
 import pandas as pd
 from django.conf import settings
+from django.db import connections
 from django.utils import timezone
 from sqlalchemy import MetaData, create_engine, inspect, text
+from sqlalchemy import column as sa_column, insert as sa_insert, select as sa_select, table as sa_table, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 from ..models import DataLineage, ImportSession, SystemConfiguration
 from .master_data_service import MasterDataService
 from ..naming_policy import resolve_template_table_name, resolve_template_column_name
 
+try:
+    import pyarrow
+except ImportError:  # optional; pandas' C parser is used without it
+    pyarrow = None
+
 logger = logging.getLogger(__name__)
 
+# Validation issues computed against destination or master data (not the file alone) carry
+# "scope": DESTINATION_SCOPE; they go stale once the destination changes.
+DESTINATION_SCOPE = "destination"
+
+# Lineage rows are written with bulk_create (never per-row create()) in batches of this size.
+LINEAGE_BATCH_SIZE = 5000
+
+# Lineage batches allowed in flight before the import loop waits for the writer.
+LINEAGE_MAX_PENDING = 2
+
+
+class _LineageWriter:
+    """Writes lineage batches on one background thread so they overlap the next chunk's inserts.
+
+    Lineage goes through Django's connection, the import through the SQLAlchemy engine, so the two
+    never share a connection. flush() re-raises any write failure in the caller's thread.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ii-lineage")
+        self._pending: List[Future] = []
+
+    def __enter__(self) -> "_LineageWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            for future in self._pending:
+                future.exception()  # wait; errors were already surfaced via flush() on the happy path
+            # The worker thread holds its own Django connections
+            self._executor.submit(connections.close_all).result()
+        finally:
+            self._executor.shutdown()
+
+    def submit(self, batch: List[DataLineage]) -> None:
+        if not batch:
+            return
+        while len(self._pending) >= LINEAGE_MAX_PENDING:
+            self._pending.pop(0).result()
+        self._pending.append(
+            self._executor.submit(DataLineage.objects.bulk_create, batch, batch_size=LINEAGE_BATCH_SIZE)
+        )
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+# import_progress is saved at most this often (seconds), and only when the percentage changed.
+PROGRESS_SAVE_INTERVAL = 0.5
+
+
+class _ProgressSaver:
+    """Keeps session.import_progress current in memory and throttles the UPDATEs behind it."""
+
+    def __init__(self, session: ImportSession) -> None:
+        self.session = session
+        self._saved = session.import_progress
+        self._saved_at = float("-inf")
+
+    def update(self, progress: int) -> None:
+        self.session.import_progress = progress
+        if time.monotonic() - self._saved_at >= PROGRESS_SAVE_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.session.import_progress != self._saved:
+            self.session.save(update_fields=['import_progress'])
+            self._saved = self.session.import_progress
+            self._saved_at = time.monotonic()
+
+
+# Keys per IN (...) list on backends without array binds (keeps statements under max_allowed_packet).
+IN_LIST_CHUNK = 1000
+
+
+def _chunks(seq: Sequence[Any], n: int) -> Iterable[Sequence[Any]]:
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+
+def _py_pk(values: Iterable[Any]) -> Tuple[Any, ...]:
+    """PK tuple of plain Python scalars: hashes on the fast path and binds as-is."""
+    return tuple(v.item() if isinstance(v, (np.integer, np.floating, np.bool_, np.str_)) else v for v in values)
+
+
+def _pk_getter(primary_keys: Sequence[str], record_keys: Iterable[str]) -> Callable[[Dict[str, Any]], Tuple[Any, ...]]:
+    """record -> PK tuple for records from _convert_dataframe_for_db (already plain Python values).
+
+    Uses a C-level itemgetter when every PK column is in the records; otherwise missing
+    columns read as None, as with record.get.
+    """
+    if primary_keys and set(primary_keys) <= set(record_keys):
+        if len(primary_keys) == 1:
+            get_one = itemgetter(primary_keys[0])
+            return lambda record: (get_one(record),)
+        return itemgetter(*primary_keys)
+    return lambda record: _py_pk(record.get(col) for col in primary_keys)
+
+
+# Parent-key backfills and plain-append import chunks larger than this go through COPY on PostgreSQL.
+COPY_INSERT_THRESHOLD = 500
+
+
+def _copy_field(value: Any) -> str:
+    # Unquoted empty is NULL in COPY CSV; everything else is quoted so '' stays an empty string
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_insert(conn, qualified_table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """COPY rows into qualified_table on conn's own transaction (PostgreSQL/psycopg2 only)."""
+    buf = io.StringIO()
+    buf.writelines(",".join(map(_copy_field, row)) + "\n" for row in rows)
+    buf.seek(0)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {qualified_table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)", buf
+        )
+    finally:
+        cursor.close()
+
+
+def _execute_values(conn, head: str, rows: Sequence[Sequence[Any]], tail: str = "", page_size: int = 1000) -> None:
+    """Run "<head> VALUES (...), (...) <tail>" as one multi-row statement per page (psycopg2 only).
+
+    head/tail are plain SQL (no placeholders); literal % signs are escaped for psycopg2.
+    """
+    from psycopg2.extras import execute_values
+
+    sql = f"{head.replace('%', '%%')} VALUES %s {tail.replace('%', '%%')}"
+    cursor = conn.connection.cursor()
+    try:
+        execute_values(cursor, sql, rows, page_size=page_size)
+    finally:
+        cursor.close()
+
 # --------------------------------------------------------------------------- #
 # File loading helpers
 # --------------------------------------------------------------------------- #
@@ -96,47 +259,118 @@ def _read_csv_with_fallback(file_path: str, *, header: int = 0) -> pd.DataFrame:
     return pd.read_csv(file_path, header=header, dtype=str)
 
 
+_NUMERIC_TOKEN_RE = r"\d+\.?\d*|\.\d+"
+
+
 def _detect_header_row_from_pd(df, max_scan=10):
-    def is_headerish(values):
-        if not values: return 0.0
-        vals = [str(v or "").strip() for v in values]
-        nonempty = [v for v in vals if v]
-        if not nonempty: return 0.0
-        distinct = len(set(nonempty)) / len(nonempty)
-        alphaish = sum(1 for v in nonempty if any(c.isalpha() for c in v)) / len(nonempty)
-        longish = any(len(v) > 40 for v in nonempty)
-        numericish = sum(1 for v in nonempty if v.replace(".", "", 1).isdigit()) / len(nonempty)
-        return max(0.0, min(1.0, 0.45*distinct + 0.45*alphaish - 0.25*numericish - (0.15 if longish else 0)))
-
-    best_idx, best_score = None, -1
-    candidates = [list(df.columns)] + [list(df.iloc[i].values) for i in range(min(max_scan, len(df)))]
-    for i, row in enumerate(candidates):
-        s = is_headerish(row)
-        if s > best_score:
-            best_idx, best_score = (None if i == 0 else i - 1), s
-    return best_idx
+    """
+    Score df.columns and the first rows as header candidates in one vectorized pass.
 
-def _load_source_dataframe(file_path: str) -> pd.DataFrame:
+    Returns None to keep df.columns, else the 0-based row index to pass as header=.
+    """
+    rows = [list(df.columns)] + df.iloc[:max_scan].values.tolist()
+    cells = pd.DataFrame(rows, dtype=object)
+    # str(v or "").strip(): falsy cells (None, 0, "") are empty; NaN stays "nan"
+    text = cells.where(cells.astype(bool), "").apply(lambda col: col.astype(str).str.strip())
+    nonempty = text != ""
+    count = nonempty.sum(axis=1).to_numpy()
+    if not count.any():
+        return None
+
+    present = text.where(nonempty)
+    distinct = present.nunique(axis=1).to_numpy()
+    alphaish = present.apply(lambda col: col.str.contains(r"[^\W\d_]")).eq(True).sum(axis=1).to_numpy()
+    numericish = present.apply(lambda col: col.str.fullmatch(_NUMERIC_TOKEN_RE)).eq(True).sum(axis=1).to_numpy()
+    longish = present.apply(lambda col: col.str.len() > 40).any(axis=1).to_numpy()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = 0.45 * (distinct / count) + 0.45 * (alphaish / count) - 0.25 * (numericish / count) - 0.15 * longish
+    score = np.where(count > 0, np.clip(score, 0.0, 1.0), 0.0)
+    best = int(score.argmax())
+    return None if best == 0 else best - 1
+
+HEADER_SAMPLE_ROWS = 50
+
+
+def _read_source(file_path: str, *, header: Optional[int], nrows: Optional[int] = None) -> pd.DataFrame:
     if file_path.lower().endswith((".xlsx", ".xls")):
-        raw = pd.read_excel(file_path, header=None, dtype=str)
-    else:
-        raw = pd.read_csv(file_path, header=None, dtype=str, engine="python", on_bad_lines="skip")
+        return pd.read_excel(file_path, header=header, dtype=str, nrows=nrows)
+    # Full reads use pyarrow's multithreaded parser when available; it supports neither
+    # nrows nor skipping ragged lines, so samples and malformed files use the C parser.
+    if pyarrow is not None and nrows is None:
+        try:
+            return pd.read_csv(file_path, header=header, dtype=str, engine="pyarrow")
+        except (pyarrow.ArrowInvalid, ValueError):
+            pass
+    return pd.read_csv(file_path, header=header, dtype=str, nrows=nrows, on_bad_lines="skip")
+
 
-    guess = _detect_header_row_from_pd(raw)
+def _load_source_dataframe(file_path: str) -> pd.DataFrame:
+    # Detect the header on a small sample, then parse the whole file once
+    sample = _read_source(file_path, header=None, nrows=HEADER_SAMPLE_ROWS)
+    guess = _detect_header_row_from_pd(sample)
+    df = _read_source(file_path, header=guess)
     if guess is None:
-        df = raw.copy()
         df.columns = [f"col_{i+1}" for i in range(df.shape[1])]
-    else:
-        if file_path.lower().endswith((".xlsx", ".xls")):
-            df = pd.read_excel(file_path, header=guess, dtype=str)
-        else:
-            df = pd.read_csv(file_path, header=guess, dtype=str, engine="python", on_bad_lines="skip")
 
     df.index = pd.RangeIndex(start=1, stop=len(df) + 1)
     df.columns = [str(c).strip() for c in df.columns]
     return df
 
 
+# Parsed source files kept per process, keyed by path and bounded by total frame size.
+# Off by default: validation and import run in whichever web worker takes the request,
+# so a hit is only likely where requests for a session stick to one process. Enable with
+# INTELLIGENT_IMPORT_CONFIG['SOURCE_CACHE_MAX_MB'] in such deployments.
+SOURCE_CACHE_MAX_MB = 0
+
+_source_cache: "OrderedDict[str, Tuple[int, int, pd.DataFrame, int]]" = OrderedDict()
+_source_cache_bytes = 0
+_source_cache_lock = threading.Lock()
+
+
+def _source_cache_limit() -> int:
+    config = getattr(settings, "INTELLIGENT_IMPORT_CONFIG", {}) or {}
+    return int(config.get("SOURCE_CACHE_MAX_MB", SOURCE_CACHE_MAX_MB)) * 1024 * 1024
+
+
+def _pop_source_entry(file_path: str) -> None:
+    global _source_cache_bytes
+    entry = _source_cache.pop(file_path, None)
+    if entry is not None:
+        _source_cache_bytes -= entry[3]
+
+
+def _get_source_dataframe(file_path: str) -> pd.DataFrame:
+    """Parsed source file, reused while path, mtime and size are unchanged. Treat as read-only."""
+    global _source_cache_bytes
+    limit = _source_cache_limit()
+    if limit <= 0:
+        return _load_source_dataframe(file_path)
+
+    st = os.stat(file_path)
+    with _source_cache_lock:
+        entry = _source_cache.get(file_path)
+        if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+            _source_cache.move_to_end(file_path)
+            return entry[2]
+
+    df = _load_source_dataframe(file_path)
+    nbytes = int(df.memory_usage(index=True, deep=True).sum())
+    with _source_cache_lock:
+        _pop_source_entry(file_path)
+        if nbytes <= limit:
+            _source_cache[file_path] = (st.st_mtime_ns, st.st_size, df, nbytes)
+            _source_cache_bytes += nbytes
+            while _source_cache_bytes > limit:
+                _pop_source_entry(next(iter(_source_cache)))
+    return df
+
+
+def evict_source_dataframe(file_path: str) -> None:
+    """Drop a cached parse once its import is done or the temp file is removed."""
+    with _source_cache_lock:
+        _pop_source_entry(file_path)
 
 
 # --------------------------------------------------------------------------- #
@@ -144,6 +378,55 @@ def _load_source_dataframe(file_path: str) -> pd.DataFrame:
 # --------------------------------------------------------------------------- #
 
 
+# executemany tuning per driver. SQLAlchemy 2.0 already folds INSERT executemany into
+# multi-row VALUES pages; on psycopg2, values_plus_batch also pages UPDATE/DELETE batches.
+_ENGINE_OPTIONS_BY_DRIVER = {
+    "postgresql": {
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 1000,
+        "executemany_batch_page_size": 500,
+    },
+    "mysql+pymysql": {"insertmanyvalues_page_size": 1000},
+}
+_ENGINE_OPTIONS_BY_DRIVER["postgresql+psycopg2"] = _ENGINE_OPTIONS_BY_DRIVER["postgresql"]
+
+
+@lru_cache(maxsize=32)
+def _engine_for_uri(uri: str):
+    options = _ENGINE_OPTIONS_BY_DRIVER.get(make_url(uri).drivername, {})
+    return create_engine(uri, pool_pre_ping=True, pool_recycle=3600, **options)
+
+
+def get_connection_engine(connection):
+    """Pooled SQLAlchemy engine for an ExternalConnection, shared per connection URI in this process."""
+    return _engine_for_uri(connection.get_connection_uri())
+
+
+@lru_cache(maxsize=512)
+def _pk_is_auto_increment(uri: str, schema: Optional[str], table: str, column: str) -> bool:
+    """Whether a PostgreSQL column is identity/serial-backed; cached per process (DDL rarely changes)."""
+    engine = _engine_for_uri(uri)
+    if engine.dialect.name != 'postgresql':
+        # MySQL and others: best-effort skip; leave mode unchanged
+        return False
+    params = {'t': table, 'c': column}
+    schema_clause = ''
+    if schema:
+        schema_clause = ' AND table_schema = :s'
+        params['s'] = schema
+    sql = (
+        "SELECT is_identity, column_default FROM information_schema.columns "
+        "WHERE table_name = :t AND column_name = :c" + schema_clause + " LIMIT 1"
+    )
+    with engine.connect() as conn:
+        row = conn.execute(text(sql), params).fetchone()
+    if not row:
+        return False
+    is_identity = (row[0] or '').upper() == 'YES'
+    has_nextval = isinstance(row[1], str) and 'nextval(' in row[1]
+    return bool(is_identity or has_nextval)
+
+
 def _map_sqlalchemy_type(sql_type: Any) -> str:
     type_name = str(sql_type).lower()
     if "int" in type_name:
@@ -168,6 +451,21 @@ def _split_schema_and_table(table_name: str, default_schema: Optional[str]) -> T
     return default_schema or None, table_name
 
 
+def _normalize_key(val: Any, do_norm: bool) -> Optional[str]:
+    if val is None:
+        return None
+    s = str(val)
+    return " ".join(s.split()).strip().lower() if do_norm else s
+
+
+def _normalize_key_series(series: pd.Series, do_norm: bool) -> pd.Series:
+    """Vectorised _normalize_key; missing values stay NA."""
+    keys = series.astype("string")
+    if do_norm:
+        keys = keys.str.replace(r"\s+", " ", regex=True).str.strip().str.lower()
+    return keys
+
+
 def get_table_schema_from_db(session: ImportSession) -> Dict[str, Any]:
     """
     Reflect the destination table and expose a structure that looks similar to
@@ -180,13 +478,7 @@ def get_table_schema_from_db(session: ImportSession) -> Dict[str, Any]:
     if not target_table_value:
         raise ValueError("Import session is missing a target table definition.")
 
-    engine = create_engine(session.connection.get_connection_uri())
-
-    def _normalize_key(val: Any, do_norm: bool) -> Optional[str]:
-        if val is None:
-            return None
-        s = str(val)
-        return " ".join(s.split()).strip().lower() if do_norm else s
+    engine = get_connection_engine(session.connection)
 
     def _ensure_child_fk(engine, child_def: Dict[str, Any], fk_column: str, pk_db_type: str, add_index: bool, parent_def: Dict[str, Any], add_fk_constraint: bool):
         schema = child_def.get("schema")
@@ -279,168 +571,163 @@ def get_table_schema_from_db(session: ImportSession) -> Dict[str, Any]:
             pkcol = pk_cols[0]
             parent_cols = parent_def.get('columns') or {}
             pk_db_type = parent_cols.get(pkcol, {}).get('db_type') or 'BIGINT'
-            # Detect auto-increment/identity on parent PK (Postgres-focused)
-            is_auto_inc = False
-            try:
-                dialect = engine.dialect.name
-                q = engine.dialect.identifier_preparer.quote
-                with engine.connect() as conn:
-                    if dialect == 'postgresql':
-                        params = {'t': table_name, 'c': pkcol}
-                        schema_clause = ''
-                        if schema:
-                            schema_clause = ' AND table_schema = :s'
-                            params['s'] = schema
-                        sql = (
-                            "SELECT is_identity, column_default FROM information_schema.columns "
-                            "WHERE table_name = :t AND column_name = :c" + schema_clause + " LIMIT 1"
-                        )
-                        row = conn.execute(text(sql), params).fetchone()
-                        if row:
-                            is_identity = (row[0] or '').upper() == 'YES'
-                            has_nextval = isinstance(row[1], str) and 'nextval(' in row[1]
-                            is_auto_inc = bool(is_identity or has_nextval)
-                    # MySQL and others: best-effort skip; leave mode unchanged
-            except Exception:
-                is_auto_inc = False
+            q = engine.dialect.identifier_preparer.quote
+            schema = parent_def.get('schema')
+            table_name = parent_def.get('table_name')
+            qualified_parent = f'{q(schema)}.{q(table_name)}' if schema else f'{q(table_name)}'
+            nk_col_q = q(parent_nk_db_col)
+            pk_q = q(pkcol)
 
             # Build keys set from raw_df
             source_series = raw_df.get(nk_source)
             if source_series is None:
                 return None
+            distinct = pd.Series(source_series.dropna().unique(), dtype=object)
             orig_by_norm: Dict[str, str] = {}
-            for v in source_series.dropna().tolist():
-                n = _normalize_key(v, do_norm)
+            for v, n in zip(distinct, _normalize_key_series(distinct, do_norm)):
                 if n and n not in orig_by_norm:
                     orig_by_norm[n] = str(v)
             norm_keys = list(orig_by_norm.keys())
             if not norm_keys:
                 return None
 
-            # Optionally enforce unique on NK (best-effort)
-            if enforce_unique:
-                try:
-                    with engine.begin() as conn:
-                        idx_name = f"ux_{table_name}_{parent_nk_db_col}"[:60]
-                        if engine.dialect.name == 'postgresql':
-                            conn.execute(text(f'CREATE UNIQUE INDEX IF NOT EXISTS {q(idx_name)} ON {qualified_parent} ({nk_col_q})'))
-                        elif engine.dialect.name == 'mysql':
-                            conn.execute(text(f'ALTER TABLE {qualified_parent} ADD UNIQUE {q(idx_name)} ({nk_col_q})'))
-                except Exception:
-                    pass
-
-            # Fetch existing
-            q = engine.dialect.identifier_preparer.quote
-            schema = parent_def.get('schema')
-            table_name = parent_def.get('table_name')
-            qualified_parent = f'{q(schema)}.{q(table_name)}' if schema else f'{q(table_name)}'
-            nk_col_q = q(parent_nk_db_col)
-            pk_q = q(pkcol)
             norm_expr = f'LOWER(TRIM({nk_col_q}))' if do_norm else f'{nk_col_q}'
-            where_terms = []
-            params: Dict[str, Any] = {}
-            for i, key in enumerate(norm_keys):
-                pname = f'k{i}'
-                where_terms.append(f':{pname}')
-                params[pname] = key
-            existing_sql = text(f'SELECT {pk_q} as id, {nk_col_q} as nk FROM {qualified_parent} WHERE {norm_expr} IN (' + ",".join(where_terms) + ")")
+            select_sql = f'SELECT {pk_q} as id, {nk_col_q} as nk FROM {qualified_parent} WHERE {norm_expr}'
             id_by_norm: Dict[str, Any] = {}
+
+            def _store_ids(rows, only_known: bool = False):
+                for r in rows:
+                    nk_val = _normalize_key(r[1], do_norm)
+                    if nk_val and (not only_known or nk_val in orig_by_norm):
+                        id_by_norm[nk_val] = r[0]
+
+            def _collect_ids(conn, keys: Sequence[str]):
+                streaming = conn.execution_options(stream_results=True)
+                if engine.dialect.name == 'postgresql':
+                    # One array bind instead of thousands of scalar placeholders
+                    _store_ids(streaming.execute(text(select_sql + ' = ANY(:keys)'), {"keys": list(keys)}))
+                    return
+                for chunk in _chunks(keys, IN_LIST_CHUNK):
+                    placeholders = ",".join(f':k{i}' for i in range(len(chunk)))
+                    params = {f'k{i}': key for i, key in enumerate(chunk)}
+                    _store_ids(streaming.execute(text(select_sql + f' IN ({placeholders})'), params))
+
+            # Detect auto-increment/identity on parent PK (Postgres-focused)
             try:
-                with engine.connect() as conn:
-                    rows = conn.execute(existing_sql, params).fetchall()
-                    for r in rows:
-                        nk_val = _normalize_key(r[1], do_norm)
-                        if nk_val:
-                            id_by_norm[nk_val] = r[0]
+                is_auto_inc = _pk_is_auto_increment(session.connection.get_connection_uri(), schema, table_name, pkcol)
             except Exception:
-                pass
+                is_auto_inc = False
 
-            missing = [n for n in norm_keys if n not in id_by_norm]
-            if missing:
-                # Optional parent PK generation; for auto-increment parents, explicitly assign MAX+1 to avoid sequence drift
-                mode = (pk_strategy.get('mode') or 'auto').lower()
-                if is_auto_inc:
-                    mode = 'auto'
-                gen_ids: Dict[str, Any] = {}
-                if is_auto_inc:
+            # One transaction on one pooled connection for every statement below;
+            # best-effort steps run in savepoints so a failure doesn't abort the rest.
+            with engine.begin() as conn:
+                # Optionally enforce unique on NK (best-effort)
+                if enforce_unique:
                     try:
-                        with engine.connect() as conn:
-                            cur_max = int(conn.execute(text(f'SELECT COALESCE(MAX({pk_q}),0) FROM {qualified_parent}')).scalar() or 0)
-                        # assign deterministic order
-                        seq = cur_max
-                        for n in sorted(missing):
-                            seq += 1
-                            gen_ids[n] = seq
+                        with conn.begin_nested():
+                            idx_name = f"ux_{table_name}_{parent_nk_db_col}"[:60]
+                            if engine.dialect.name == 'postgresql':
+                                conn.execute(text(f'CREATE UNIQUE INDEX IF NOT EXISTS {q(idx_name)} ON {qualified_parent} ({nk_col_q})'))
+                            elif engine.dialect.name == 'mysql':
+                                conn.execute(text(f'ALTER TABLE {qualified_parent} ADD UNIQUE {q(idx_name)} ({nk_col_q})'))
                     except Exception:
-                        gen_ids = {}
-                if mode in ('uuid', 'max_plus_one', 'pattern') and not gen_ids:
-                    try:
-                        with engine.connect() as conn:
-                            # current max id for numeric
-                            max_id = 0
-                            if mode == 'max_plus_one':
-                                try:
+                        pass
+
+                # Fetch existing
+                try:
+                    with conn.begin_nested():
+                        _collect_ids(conn, norm_keys)
+                except Exception:
+                    pass
+
+                missing = [n for n in norm_keys if n not in id_by_norm]
+                if missing:
+                    # Optional parent PK generation; for auto-increment parents, explicitly assign MAX+1 to avoid sequence drift
+                    mode = (pk_strategy.get('mode') or 'auto').lower()
+                    if is_auto_inc:
+                        mode = 'max_plus_one'
+                    gen_ids: Dict[str, Any] = {}
+                    if mode in ('uuid', 'max_plus_one', 'pattern'):
+                        try:
+                            with conn.begin_nested():
+                                max_id = 0
+                                if mode == 'max_plus_one':
                                     max_id = int(conn.execute(text(f'SELECT COALESCE(MAX({pk_q}),0) FROM {qualified_parent}')).scalar() or 0)
-                                except Exception:
-                                    max_id = 0
-                            seq = 0
-                            if mode == 'pattern':
                                 prefix = str(pk_strategy.get('prefix') or '')
                                 width = int(pk_strategy.get('width') or 0)
-                                like = prefix.replace('%','%%') + '%'
-                                try:
+                                seq = 0
+                                if mode == 'pattern':
+                                    like = prefix.replace('%','%%') + '%'
                                     rows = conn.execute(text(f"SELECT {pk_q} FROM {qualified_parent} WHERE {pk_q} LIKE :lk"), {"lk": like}).fetchall()
-                                except Exception:
-                                    rows = []
-                                for r in rows:
-                                    try:
+                                    for r in rows:
                                         sid = str(r[0])
-                                        if sid.startswith(prefix):
-                                            suff = sid[len(prefix):]
-                                            num = int(suff)
-                                            if num > seq:
-                                                seq = num
-                                    except Exception:
-                                        continue
-                            import uuid as _uuid
-                            for n in missing:
-                                if mode == 'uuid':
-                                    gen_ids[n] = str(_uuid.uuid4())
-                                elif mode == 'max_plus_one':
-                                    max_id += 1
-                                    gen_ids[n] = max_id
-                                elif mode == 'pattern':
-                                    prefix = str(pk_strategy.get('prefix') or '')
-                                    width = int(pk_strategy.get('width') or 0)
-                                    seq = seq + 1
-                                    gen_ids[n] = f"{prefix}{str(seq).zfill(width) if width>0 else seq}"
-                    except Exception:
-                        gen_ids = {}
-                try:
-                    with engine.begin() as conn:
+                                        suff = sid[len(prefix):] if sid.startswith(prefix) else ''
+                                        if suff.isdigit() and int(suff) > seq:
+                                            seq = int(suff)
+                                import uuid as _uuid
+                                # assign deterministic order
+                                for n in sorted(missing):
+                                    if mode == 'uuid':
+                                        gen_ids[n] = str(_uuid.uuid4())
+                                    elif mode == 'max_plus_one':
+                                        max_id += 1
+                                        gen_ids[n] = max_id
+                                    else:
+                                        seq += 1
+                                        gen_ids[n] = f"{prefix}{str(seq).zfill(width) if width>0 else seq}"
+                        except Exception:
+                            gen_ids = {}
+                    is_pg = engine.dialect.name == 'postgresql'
+                    copied = False
+                    if is_pg and len(missing) > COPY_INSERT_THRESHOLD:
+                        # Large backfill: stream the keys through COPY, then re-select the ids
+                        try:
+                            with conn.begin_nested():
+                                if gen_ids:
+                                    _copy_insert(conn, qualified_parent, [pk_q, nk_col_q],
+                                                 ((gen_ids.get(n), orig_by_norm[n]) for n in missing))
+                                else:
+                                    _copy_insert(conn, qualified_parent, [nk_col_q],
+                                                 ((orig_by_norm[n],) for n in missing))
+                            copied = True
+                        except Exception:
+                            copied = False
+                    if not copied:
+                        parent_t = sa_table(table_name, sa_column(pkcol), sa_column(parent_nk_db_col), schema=schema)
+                        if is_pg:
+                            # Keys another importer inserted meanwhile are skipped rather than failing
+                            # the batch; RETURNING hands back the new ids without a second lookup
+                            ins = pg_insert(parent_t).on_conflict_do_nothing().returning(
+                                parent_t.c[pkcol], parent_t.c[parent_nk_db_col]
+                            )
+                        else:
+                            ins = sa_insert(parent_t)
                         if gen_ids:
-                            ins = text(f'INSERT INTO {qualified_parent} ({pk_q}, {nk_col_q}) VALUES (:idv, :v)')
-                            conn.execute(ins, [{"idv": gen_ids.get(n), "v": orig_by_norm[n]} for n in missing])
+                            rows = [{pkcol: gen_ids.get(n), parent_nk_db_col: orig_by_norm[n]} for n in missing]
                         else:
-                            ins = text(f'INSERT INTO {qualified_parent} ({nk_col_q}) VALUES (:v)')
-                            conn.execute(ins, [{"v": orig_by_norm[n]} for n in missing])
-                except Exception:
-                    pass
-                # After explicit id assignment for auto-increment, align the sequence again
-                if is_auto_inc:
-                    try:
-                        _sync_serial_sequence(engine, parent_def, id_column=pkcol)
-                    except Exception:
-                        pass
-                try:
-                    with engine.connect() as conn:
-                        rows = conn.execute(existing_sql, params).fetchall()
-                        for r in rows:
-                            nk_val = _normalize_key(r[1], do_norm)
-                            if nk_val and nk_val in orig_by_norm:
-                                id_by_norm[nk_val] = r[0]
-                except Exception:
-                    pass
+                            rows = [{parent_nk_db_col: orig_by_norm[n]} for n in missing]
+                        try:
+                            with conn.begin_nested():
+                                result = conn.execute(ins, rows)
+                                if is_pg:
+                                    _store_ids(result, only_known=True)
+                        except Exception:
+                            pass
+                    # Re-select only what RETURNING didn't cover (conflicts, COPY, other backends)
+                    unresolved = [n for n in missing if n not in id_by_norm]
+                    if unresolved:
+                        try:
+                            with conn.begin_nested():
+                                _collect_ids(conn, unresolved)
+                        except Exception:
+                            pass
+                    # After explicit id assignment for auto-increment, align the sequence again
+                    if is_auto_inc:
+                        try:
+                            with conn.begin_nested():
+                                _sync_serial_sequence_on(conn, parent_def, id_column=pkcol)
+                        except Exception:
+                            pass
 
             _ensure_child_fk(engine, child_def, fk_column, pk_db_type, add_index, parent_def, add_fk_constraint)
 
@@ -506,12 +793,14 @@ def get_table_schema_from_db(session: ImportSession) -> Dict[str, Any]:
                 "schema": schema,
                 "table_name": bare_table,
             }
-        }
+        },
+        # bare table name -> key in "tables", so callers resolve unqualified names without scanning
+        "bare_index": {bare_table: qualified_name},
     }
 
 def _reflect_single_table_definition(session: ImportSession, target_table_value: str) -> Dict[str, Any]:
     """Reflect exactly one table and return a table_def dict."""
-    engine = create_engine(session.connection.get_connection_uri())
+    engine = get_connection_engine(session.connection)
     inspector = inspect(engine)
     if "." in target_table_value:
         schema, bare_table = target_table_value.split(".", 1)
@@ -587,56 +876,99 @@ def _reflect_single_table_definition(session: ImportSession, target_table_value:
 # --------------------------------------------------------------------------- #
 
 
+# Nullable string dtype for cleaned text columns; Arrow-backed buffers when pyarrow is installed.
+STRING_DTYPE = "string[pyarrow]" if pyarrow is not None else "string"
+_BLANK_TOKENS = ("", "NULL", "N/A")
+
+
 def _clean_series(series: pd.Series) -> pd.Series:
-    if series.dtype == object:
-        series = series.astype(str).str.strip()
-    series = series.replace({"": pd.NA, "NULL": pd.NA, "N/A": pd.NA})
-    return series
+    if series.dtype != object:
+        return series
+    # astype(str) would turn missing cells into the text "nan"; the string dtype keeps them NA
+    series = series.astype(STRING_DTYPE).str.strip()
+    return series.mask(series.isin(_BLANK_TOKENS))
+
+
+# Candidate formats for DATE/DATETIME columns; day- and month-first both listed so an
+# ambiguous sample (every value fits both) falls back to pandas' own inference.
+_DATETIME_FORMATS = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d/%m/%Y %H:%M:%S",
+)
+DATETIME_SNIFF_ROWS = 50
+
+
+def _guess_datetime_format(series: pd.Series) -> Optional[str]:
+    """The one candidate format that parses all of the first non-null values, else None."""
+    if not (series.dtype == object or isinstance(series.dtype, pd.StringDtype)):
+        return None
+    sample = series.dropna().head(DATETIME_SNIFF_ROWS).astype(str)
+    if sample.empty:
+        return None
+    matches = [
+        fmt for fmt in _DATETIME_FORMATS
+        if pd.to_datetime(sample, format=fmt, errors="coerce").notna().all()
+    ]
+    return matches[0] if len(matches) == 1 else None
 
 
-def _coerce_column(series: pd.Series, data_type: str) -> Tuple[pd.Series, List[int]]:
-    errors: List[int] = []
-    working = series.copy()
+_TRUE_TOKENS = ("true", "yes", "y", "1")
+_FALSE_TOKENS = ("false", "no", "n", "0")
+
 
+def _coerce_column(series: pd.Series, data_type: str) -> Tuple[pd.Series, List[int]]:
+    # pandas conversions return new objects, so the input is not copied first
     if data_type == "INTEGER":
-        coerced = pd.to_numeric(working, errors="coerce").astype("Int64")
+        numeric = pd.to_numeric(series, errors="coerce")
+        if numeric.dtype.kind == "f":
+            # Fractional / out-of-range values count as invalid rather than failing the Int64 cast
+            values = numeric.to_numpy(dtype="float64", na_value=np.nan)
+            numeric = numeric.mask((np.trunc(values) != values) | ~(np.abs(values) < 2**63))
+        coerced = numeric.astype("Int64")
     elif data_type == "DECIMAL":
-        coerced = pd.to_numeric(working, errors="coerce")
+        coerced = pd.to_numeric(series, errors="coerce").astype("Float64")
     elif data_type == "BOOLEAN":
-        bool_map = {
-            "true": True,
-            "false": False,
-            "yes": True,
-            "no": False,
-            "y": True,
-            "n": False,
-            "1": True,
-            "0": False,
-        }
-        coerced = working.astype(str).str.lower().map(bool_map)
-        coerced = coerced.astype("boolean")
+        lower = series.astype(STRING_DTYPE).str.lower()
+        coerced = pd.Series(
+            np.where(lower.isin(_TRUE_TOKENS), True, np.where(lower.isin(_FALSE_TOKENS), False, None)),
+            index=series.index,
+            dtype="boolean",
+        )
     elif data_type in {"DATE", "DATETIME"}:
-        coerced = pd.to_datetime(working, errors="coerce")
+        # An explicit format keeps pandas on its vectorised parser instead of per-cell dateutil
+        coerced = pd.to_datetime(series, errors="coerce", format=_guess_datetime_format(series))
         if data_type == "DATE":
             coerced = coerced.dt.date
         else:
             coerced = coerced.dt.tz_localize(None)
     else:  # TEXT/JSON fallback
-        coerced = working.astype(str)
+        coerced = series if isinstance(series.dtype, pd.StringDtype) else series.astype(STRING_DTYPE)
 
-    if hasattr(coerced, "isna"):
-        invalid_mask = working.notna() & coerced.isna()
-        if invalid_mask.any():
-            errors = working[invalid_mask].index.tolist()
+    invalid = series.notna().to_numpy() & coerced.isna().to_numpy()
+    errors: List[int] = series.index.values[np.flatnonzero(invalid)].tolist()
     return coerced, errors
 
 
 def _serialize_preview(df: pd.DataFrame, limit: int = 10) -> List[Dict[str, Any]]:
-    preview = df.head(limit).copy()
-    for column in preview.columns:
-        if pd.api.types.is_datetime64_any_dtype(preview[column]):
-            preview[column] = preview[column].dt.tz_localize(None)
-        preview[column] = preview[column].apply(_serialise_scalar)
+    preview = df.head(limit)
+    converted = {}
+    for idx, column in enumerate(preview.columns):
+        series = preview.iloc[:, idx]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Same text as Timestamp.isoformat(), without a Python call per cell
+            iso = np.datetime_as_string(series.dt.tz_localize(None).to_numpy(), unit="us")
+            converted[idx] = pd.Series(iso, index=series.index).str.replace(r"\.000000$", "", regex=True)
+        elif series.dtype == object:
+            # Only object columns can hold date/time objects (e.g. DATE columns)
+            converted[idx] = series.map(_serialise_scalar)
+    if converted:
+        preview = preview.copy()
+        for idx, values in converted.items():
+            preview.isetitem(idx, values)
     return preview.where(pd.notnull(preview), None).to_dict("records")
 
 
@@ -651,6 +983,25 @@ def _serialise_scalar(value: Any) -> Any:
     return value
 
 
+_DATELIKE_INFERRED = frozenset({"datetime64", "datetime", "date", "time", "mixed"})
+
+
+def _serialise_series(series: pd.Series) -> np.ndarray:
+    """Column-wise _serialise_scalar as a fresh object array, with None for missing cells."""
+    if pd.api.types.is_datetime64_dtype(series):
+        iso = pd.Series(np.datetime_as_string(series.to_numpy(), unit="us"))
+        values = iso.str.replace(r"\.000000$", "", regex=True).to_numpy(dtype=object)
+    elif pd.api.types.is_datetime64_any_dtype(series) or (
+        series.dtype == object and pd.api.types.infer_dtype(series, skipna=True) in _DATELIKE_INFERRED
+    ):
+        # tz-aware timestamps and date/time objects keep the per-cell isoformat()
+        values = series.map(_serialise_scalar).to_numpy(dtype=object)
+    else:
+        values = series.to_numpy(dtype=object, copy=True)
+    values[series.isna().to_numpy()] = None
+    return values
+
+
 def _normalise_mapping_entry(mapping_entry: Any) -> Dict[str, Any]:
     """
     Accept legacy and new UI mapping shapes and ensure a 'field' key exists.
@@ -678,18 +1029,54 @@ def _normalise_mapping_entry(mapping_entry: Any) -> Dict[str, Any]:
     return {}
 
 
-def _convert_record_for_db(record: Dict[str, Any]) -> Dict[str, Any]:
-    converted = {}
-    for key, value in record.items():
-        if isinstance(value, pd.Timestamp):
-            converted[key] = value.to_pydatetime()
-        elif hasattr(value, "to_pydatetime"):
-            converted[key] = value.to_pydatetime()
-        elif isinstance(value, pd.Series):  # pragmatic safety
-            converted[key] = value.squeeze().item() if not value.empty else None
+def _pks_all_empty(records: List[Dict[str, Any]], primary_keys: Sequence[str]) -> bool:
+    """True when there is no PK, or every PK cell of every record is None/''.
+
+    Walks record by record, so a populated PK usually stops the scan at the first record.
+    """
+    for record in records:
+        for pk in primary_keys:
+            if record.get(pk) not in (None, ''):
+                return False
+    return True
+
+
+def _dedupe_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated records, keeping the first occurrence.
+
+    Records from one DataFrame share key order, so the items tuple itself is the set key
+    (exact, unlike a digest); records with unhashable values (lists/dicts) key on their JSON text.
+    """
+    seen: Set[Any] = set()
+    unique = []
+    for record in records:
+        key: Any = tuple(record.items())
+        try:
+            is_new = key not in seen
+        except TypeError:
+            key = json.dumps(record, sort_keys=True, default=str)
+            is_new = key not in seen
+        if is_new:
+            seen.add(key)
+            unique.append(record)
+    return unique
+
+
+def _convert_dataframe_for_db(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Records of DB-ready Python values (None for nulls, datetime for timestamps), converted per column."""
+    names = list(df.columns)
+    columns = []
+    for idx in range(df.shape[1]):
+        series = df.iloc[:, idx]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            values = series.array.to_pydatetime()
         else:
-            converted[key] = value
-    return converted
+            values = series.to_numpy(dtype=object, copy=True)
+        missing = series.isna().to_numpy()
+        if missing.any():
+            values[missing] = None
+        columns.append(values.tolist())
+    return [dict(zip(names, row)) for row in zip(*columns)]
 
 
 # --------------------------------------------------------------------------- #
@@ -703,16 +1090,21 @@ def process_and_validate_data(
     column_mapping: Dict[str, Any],
     *,
     return_dataframe: bool = False,
+    preview_limit: Optional[int] = None,
 ) -> Any:
     if not column_mapping:
         raise ValueError("Column mapping is required before validation.")
+    if preview_limit is None:
+        preview_limit = 10
 
     # Reflect target table schema (fallback gracefully if table not yet created)
     try:
         schema_definition = get_table_schema_from_db(session)
         tables_map = schema_definition.get("tables", {})
+        bare_index = schema_definition.get("bare_index") or {}
     except Exception:
         tables_map = {}
+        bare_index = {}
 
     # Resolve the correct key regardless of schema-qualified vs bare names
     desired = (
@@ -727,11 +1119,7 @@ def process_and_validate_data(
             table_key = desired
         else:
             # try to match by bare name against qualified keys
-            bare = desired.split(".")[-1] if desired else ""
-            for k in tables_map.keys():
-                if k == bare or k.endswith(f".{bare}"):
-                    table_key = k
-                    break
+            table_key = bare_index.get(desired.rsplit(".", 1)[-1]) if desired else None
         if table_key is None:
             # fall back to first entry
             table_key = next(iter(tables_map.keys()))
@@ -749,8 +1137,9 @@ def process_and_validate_data(
             "table_name": (desired.split(".")[-1] if desired else ''),
         }
 
-    source_df = _load_source_dataframe(file_path)
-    processed_df = pd.DataFrame(index=source_df.index)
+    source_df = _get_source_dataframe(file_path)
+    # Collect mapped columns first and build the frame once; per-column inserts copy the block each time
+    mapped_columns: Dict[str, Any] = {}
 
     errors: List[Dict[str, Any]] = []
     warnings: List[Dict[str, Any]] = []
@@ -790,9 +1179,9 @@ def process_and_validate_data(
                             fill_value = getattr(session.user, "username", None) or None
                         except Exception:
                             fill_value = None
-                processed_df[target_field] = [fill_value] * len(source_df)
+                mapped_columns[target_field] = [fill_value] * len(source_df)
             elif fill_mode == "auto_sequence":
-                processed_df[target_field] = list(range(1, len(source_df) + 1))
+                mapped_columns[target_field] = np.arange(1, len(source_df) + 1)
             else:
                 warnings.append({
                     "column": target_field,
@@ -809,13 +1198,13 @@ def process_and_validate_data(
             )
             continue
 
-        series = source_df[source_column].copy()
+        series = source_df[source_column]
 
         if mapping.get("master_model"):
             master_model = mapping["master_model"]
             lookup_field = mapping.get("lookup_field", "name")
 
-            names_to_lookup = [value for value in series.dropna().unique()]
+            names_to_lookup = series.dropna().unique().tolist()
             name_to_id_map, not_found = master_data_service.get_ids_from_names(
                 master_model, names_to_lookup, lookup_field=lookup_field
             )
@@ -827,13 +1216,14 @@ def process_and_validate_data(
                         "column": source_column,
                         "issue": f"{len(not_found)} master data values require approval.",
                         "values": sorted(list(not_found))[:10],
+                        "scope": DESTINATION_SCOPE,
                     }
                 )
 
-            mapped_series = series.apply(lambda value: name_to_id_map.get(value))
-            processed_df[target_field] = mapped_series
+            mapped_series = series.map(name_to_id_map)
+            mapped_columns[target_field] = mapped_series
 
-            unresolved_mask = series.notna() & processed_df[target_field].isna()
+            unresolved_mask = series.notna() & mapped_series.isna()
             if unresolved_mask.any():
                 rows = series.index[unresolved_mask].tolist()
                 errors.append(
@@ -841,14 +1231,21 @@ def process_and_validate_data(
                         "column": source_column,
                         "issue": "Some values could not be mapped to master data IDs.",
                         "rows": rows[:10],
+                        "scope": DESTINATION_SCOPE,
                     }
                 )
             continue
 
-        processed_df[target_field] = series
+        mapped_columns[target_field] = series
 
     valid_columns = set(table_def["columns"].keys())
-    processed_df = processed_df[[col for col in processed_df.columns if col in valid_columns]]
+    processed_df = pd.DataFrame(
+        {col: values for col, values in mapped_columns.items() if col in valid_columns},
+        index=source_df.index,
+        copy=False,
+    )
+
+    coerced_columns: Dict[str, pd.Series] = {}
 
     # Coerce data types and enforce basic validation rules.
     for column_name, column_meta in table_def["columns"].items():
@@ -872,7 +1269,7 @@ def process_and_validate_data(
 
         cleaned = _clean_series(processed_df[column_name])
         coerced, validation_errors = _coerce_column(cleaned, column_meta["data_type"])
-        processed_df[column_name] = coerced
+        coerced_columns[column_name] = coerced
 
         if validation_errors:
             errors.append(
@@ -885,9 +1282,9 @@ def process_and_validate_data(
 
         if (
             not column_meta.get("nullable", True)
-            and processed_df[column_name].isna().any()
+            and coerced.isna().any()
         ):
-            rows = processed_df.index[processed_df[column_name].isna()].tolist()
+            rows = processed_df.index[coerced.isna()].tolist()
             errors.append(
                 {
                     "column": column_name,
@@ -896,8 +1293,12 @@ def process_and_validate_data(
                 }
             )
 
+    if coerced_columns:
+        processed_df = processed_df.assign(**coerced_columns)
+
     # Duplicate detection: within file
     primary_key_cols = table_def.get("primary_key", [])
+    existing_ids: Optional[Set[Any]] = None
     if primary_key_cols:
         if all(col in processed_df.columns for col in primary_key_cols):
             duplicate_mask = processed_df.duplicated(subset=primary_key_cols, keep=False)
@@ -928,6 +1329,7 @@ def process_and_validate_data(
                             "column": pk_col,
                             "issue": f"{len(existing_ids)} rows already exist in the destination table.",
                             "values": sorted(list(existing_ids))[:10],
+                            "scope": DESTINATION_SCOPE,
                         }
                     )
         else:
@@ -946,43 +1348,33 @@ def process_and_validate_data(
     db_duplicates: List[int] = []
     db_conflicts: List[int] = []
     if primary_key_cols and all(col in processed_df.columns for col in primary_key_cols):
-        # Build PK tuples for each row in order
-        pk_tuples: List[Tuple[Any, ...]] = [
-            tuple(processed_df.loc[idx, col] for col in primary_key_cols)
-            for idx in processed_df.index
-        ]
+        # Build PK tuples for each row in order, from one array pass instead of .loc per cell
+        col_names = list(processed_df.columns)
+        pk_tuples: List[Tuple[Any, ...]] = list(map(_py_pk, processed_df[primary_key_cols].to_numpy(dtype=object).tolist()))
+        lookup_pks = list(dict.fromkeys(pk_tuples))
+        if existing_ids is not None:
+            # Single-column PK: the existence probe above already says which keys are in the table
+            lookup_pks = [pk for pk in lookup_pks if pk[0] in existing_ids]
+        table_columns = table_def.get("columns") or {}
         existing_by_pk = _fetch_existing_rows_by_pk(
             session,
             table_def,
-            pk_values=pk_tuples,
-            columns=list(processed_df.columns),
+            pk_values=lookup_pks,
+            compare_columns=[c for c in col_names if not table_columns or c in table_columns],
         )
 
-        for idx in processed_df.index:
-            pk = tuple(processed_df.loc[idx, col] for col in primary_key_cols)
-            if pk in existing_by_pk:
-                db_row = existing_by_pk[pk]
-                # Compare mapped columns after basic serialisation
-                exact = True
-                for col in processed_df.columns:
-                    left = _serialise_scalar(processed_df.loc[idx, col])
-                    right = _serialise_scalar(db_row.get(col))
-                    # Treat both NaN/None as equal
-                    try:
-                        left_isna = pd.isna(left)
-                        right_isna = pd.isna(right)
-                    except Exception:
-                        left_isna = left is None
-                        right_isna = right is None
-                    if left_isna and right_isna:
-                        continue
-                    if left != right:
-                        exact = False
-                        break
-                if exact:
-                    db_duplicates.append(int(idx))
-                else:
-                    db_conflicts.append(int(idx))
+        matched = [pos for pos, pk in enumerate(pk_tuples) if pk in existing_by_pk]
+        if matched:
+            # Compare serialised values column by column; missing cells are None on both
+            # sides, so a single elementwise == also treats null/null as equal
+            left_df = processed_df.iloc[matched]
+            right_df = pd.DataFrame([existing_by_pk[pk_tuples[pos]] for pos in matched], columns=col_names)
+            left = np.column_stack([_serialise_series(left_df.iloc[:, j]) for j in range(len(col_names))])
+            right = np.column_stack([_serialise_series(right_df.iloc[:, j]) for j in range(len(col_names))])
+            exact_mask = (left == right).all(axis=1)
+            matched_idx = processed_df.index[matched]
+            db_duplicates = [int(idx) for idx in matched_idx[exact_mask]]
+            db_conflicts = [int(idx) for idx in matched_idx[~exact_mask]]
 
         if db_duplicates:
             warnings.append(
@@ -990,6 +1382,7 @@ def process_and_validate_data(
                     "column": ", ".join(primary_key_cols),
                     "issue": "Exact duplicate rows already exist in destination table.",
                     "rows": db_duplicates[:10],
+                    "scope": DESTINATION_SCOPE,
                 }
             )
         if db_conflicts:
@@ -998,21 +1391,20 @@ def process_and_validate_data(
                     "column": ", ".join(primary_key_cols),
                     "issue": "Row exists with same primary key but different values (append-only policy).",
                     "rows": db_conflicts[:10],
+                    "scope": DESTINATION_SCOPE,
                 }
             )
 
     # Build preview records; if nothing mapped yet, fall back to raw source preview
     if len(processed_df.columns) > 0:
-        preview_records = _serialize_preview(processed_df)
+        preview_records = _serialize_preview(processed_df, limit=preview_limit)
     else:
-        preview_records = _serialize_preview(source_df)
+        preview_records = _serialize_preview(source_df, limit=preview_limit)
     total_errors = len(errors)
     total_warnings = len(warnings)
 
     # Exact duplicate detection
-    consider_cols = [c for c in processed_df.columns]
-    rows = processed_df.to_dict(orient="records")
-    dups = find_exact_duplicates(rows, consider_cols)
+    dups = find_exact_duplicates(processed_df, list(processed_df.columns))
 
     validation_results = {
         "errors": errors,
@@ -1065,16 +1457,22 @@ def _fetch_existing_primary_keys(
     schema = table_def.get("schema")
     table_name = table_def.get("table_name")
 
-    engine = create_engine(session.connection.get_connection_uri())
-    placeholder = ", ".join([":v{}".format(idx) for idx, _ in enumerate(values)])
+    engine = get_connection_engine(session.connection)
     qualified = f"{schema}.{table_name}" if schema else table_name
-    query = text(f"SELECT {pk_col} FROM {qualified} WHERE {pk_col} IN ({placeholder})")
-    params = {f"v{idx}": value for idx, value in enumerate(values)}
+    select_sql = f"SELECT {pk_col} FROM {qualified} WHERE {pk_col}"
 
     try:
         with engine.connect() as connection:
-            result = connection.execute(query, params)
-            return {row[0] for row in result.fetchall()}
+            if engine.dialect.name == "postgresql":
+                result = connection.execute(text(select_sql + " = ANY(:values)"), {"values": list(values)})
+                return {row[0] for row in result}
+            found: Set[Any] = set()
+            for chunk in _chunks(list(values), IN_LIST_CHUNK):
+                placeholder = ", ".join(f":v{idx}" for idx in range(len(chunk)))
+                params = {f"v{idx}": value for idx, value in enumerate(chunk)}
+                result = connection.execute(text(select_sql + f" IN ({placeholder})"), params)
+                found.update(row[0] for row in result)
+            return found
     except SQLAlchemyError as exc:
         logger.warning("Failed to fetch existing primary keys: %s", exc)
         return set()
@@ -1085,11 +1483,12 @@ def _fetch_existing_rows_by_pk(
     table_def: Dict[str, Any],
     *,
     pk_values: Sequence[Tuple[Any, ...]],
-    columns: Sequence[str],
+    compare_columns: Optional[Sequence[str]] = None,
 ) -> Dict[Tuple[Any, ...], Dict[str, Any]]:
     """
     Fetch existing rows keyed by composite primary key tuple for the given set of PK values.
-    Returns a dict {(pk1, pk2, ...): {col: value, ...}}
+    Returns a dict {(pk1, pk2, ...): {col: value, ...}}; only the PK columns are selected
+    unless compare_columns asks for more (existence checks need nothing else).
     """
     if not pk_values:
         return {}
@@ -1100,46 +1499,60 @@ def _fetch_existing_rows_by_pk(
 
     schema = table_def.get("schema")
     table_name = table_def.get("table_name")
-    engine = create_engine(session.connection.get_connection_uri())
+    engine = get_connection_engine(session.connection)
 
     # Build select list; ensure PK columns are included
-    cols = list(dict.fromkeys([*pk_cols, *columns]))
-    col_list = ", ".join([f'"{c}"' for c in cols])
-    qualified = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
-
-    # Build OR-ed predicates for composite PK tuples
-    where_clauses = []
-    params: Dict[str, Any] = {}
-    for i, pk_tuple in enumerate(pk_values):
+    cols = list(dict.fromkeys([*pk_cols, *(compare_columns or ())]))
+    tbl = sa_table(table_name, *(sa_column(c) for c in cols), schema=schema)
+    # One row-value IN per chunk, e.g. ("a", "b") IN ((:p1, :p2), ...), instead of OR-ed AND groups
+    pk_expr = tbl.c[pk_cols[0]] if len(pk_cols) == 1 else tuple_(*(tbl.c[c] for c in pk_cols))
+
+    keys: List[Any] = []
+    for pk_tuple in pk_values:
         if not isinstance(pk_tuple, (tuple, list)):
             pk_tuple = (pk_tuple,)
-        terms = []
-        for j, col in enumerate(pk_cols):
-            pname = f"p_{i}_{j}"
-            terms.append(f'"{col}" = :{pname}')
-            params[pname] = pk_tuple[j] if j < len(pk_tuple) else None
-        where_clauses.append("(" + " AND ".join(terms) + ")")
-
-    if not where_clauses:
-        return {}
-
-    sql = f"SELECT {col_list} FROM {qualified} WHERE " + " OR ".join(where_clauses)
+        pk_tuple = _py_pk(pk_tuple[j] if j < len(pk_tuple) else None for j in range(len(pk_cols)))
+        keys.append(pk_tuple[0] if len(pk_cols) == 1 else pk_tuple)
 
     out: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
     try:
         with engine.connect() as conn:
-            result = conn.execute(text(sql), params)
-            rows = result.fetchall()
-            for row in rows:
-                row_dict = dict(row._mapping)
-                pk_key = tuple(row_dict[col] for col in pk_cols)
-                out[pk_key] = row_dict
+            for chunk in _chunks(keys, IN_LIST_CHUNK):
+                result = conn.execute(sa_select(*tbl.c).where(pk_expr.in_(list(chunk))))
+                for row in result:
+                    row_dict = dict(row._mapping)
+                    pk_key = tuple(row_dict[col] for col in pk_cols)
+                    out[pk_key] = row_dict
     except SQLAlchemyError as exc:
         logger.warning("Failed to fetch existing rows by PK: %s", exc)
         return {}
     return out
 
 
+def _existing_key_tuples(
+    conn,
+    schema: Optional[str],
+    table_name: str,
+    key_cols: Sequence[str],
+    keys: Sequence[Tuple[Any, ...]],
+) -> Set[Tuple[Any, ...]]:
+    """Subset of keys (tuples over key_cols) already present in the table.
+
+    One row-value IN per IN_LIST_CHUNK keys, e.g. ("a", "b") IN ((:p1, :p2), ...),
+    instead of an OR-ed AND group (and K bound names) per key.
+    """
+    if not keys:
+        return set()
+    tbl = sa_table(table_name, *(sa_column(c) for c in key_cols), schema=schema)
+    single = len(key_cols) == 1
+    key_expr = tbl.c[key_cols[0]] if single else tuple_(*tbl.c)
+    distinct = [k[0] if single else k for k in dict.fromkeys(keys)]
+    found: Set[Tuple[Any, ...]] = set()
+    for chunk in _chunks(distinct, IN_LIST_CHUNK):
+        found.update(tuple(row) for row in conn.execute(sa_select(*tbl.c).where(key_expr.in_(list(chunk)))))
+    return found
+
+
 def execute_data_import(session: ImportSession, effective_mode: str = "append") -> Dict[str, Any]:
     config = SystemConfiguration.get_config()
     temp_path = os.path.join(
@@ -1197,6 +1610,8 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
         per_table_map.setdefault(tgt_table, {})[src] = m
 
     raw_df = context["raw_dataframe"]
+    # Lineage original_data for every table and chunk; converted once and sliced per chunk
+    raw_records = raw_df.to_dict(orient="records")
 
     # Load duplicate decisions (by processed_df row index)
     analysis = getattr(session, 'analysis_summary', None) or {}
@@ -1210,9 +1625,9 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
             if pd.api.types.is_bool_dtype(series):
                 return 'BOOLEAN'
             if pd.api.types.is_integer_dtype(series):
-                # choose BIGINT if any large
+                # choose BIGINT if any large (already integer dtype, so no to_numeric copy)
                 try:
-                    if pd.to_numeric(series, errors='coerce').max() >= 2**31:
+                    if series.abs().max() >= 2**31:
                         return 'BIGINT'
                 except Exception:
                     pass
@@ -1223,39 +1638,59 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                 return 'TIMESTAMP'
         except Exception:
             pass
-        # fallback varchar sizing
+        # fallback varchar sizing, measured on (at most 10k) non-null values only
         try:
-            max_len = int(series.astype(str).str.len().max() or 0)
+            non_null = series.dropna().head(10_000)
+            max_len = 0 if non_null.empty else int(non_null.astype(str).str.len().max())
             if max_len > 255:
                 return 'TEXT'
             return f'VARCHAR({max(50, min(255, int(max_len*1.2)+10))})'
         except Exception:
             return 'TEXT'
 
-    engine = create_engine(session.connection.get_connection_uri())
+    engine = get_connection_engine(session.connection)
+    # One inspector (and reflection cache) for the whole import; cleared after our own DDL
+    insp = inspect(engine)
+
+    # Destination tables that already exist, with their columns, reflected once up front:
+    # one table-name query plus one multi-table column query instead of N has_table/get_columns.
+    existing_columns: Optional[Dict[str, List[str]]] = None
+    if per_table_map:
+        try:
+            table_names = set(insp.get_table_names())
+            present = [t for t in per_table_map if t in table_names]
+            existing_columns = {t: [] for t in present}
+            if present:
+                for (_, t), cols in insp.get_multi_columns(filter_names=present).items():
+                    existing_columns[t] = [c['name'] for c in cols]
+        except Exception:
+            existing_columns = None
 
     def _ensure_table_exists(tname: str, df_sample: pd.DataFrame):
         q = engine.dialect.identifier_preparer.quote
-        with engine.connect() as conn:
-            insp = inspect(engine)
-            exists = False
+        if existing_columns is not None:
+            exists = tname in existing_columns
+            existing_cols = existing_columns.get(tname, [])
+        else:
             try:
                 exists = insp.has_table(tname)
             except Exception:
-                exists = engine.dialect.has_table(conn, tname)
-            if exists:
-                # Add any missing columns present in the sample
-                try:
-                    existing_cols = [c['name'] for c in insp.get_columns(tname)]
-                except Exception:
-                    existing_cols = []
-                to_add = [c for c in df_sample.columns if c not in existing_cols]
-                if to_add:
-                    with engine.begin() as w:
-                        for c in to_add:
-                            sqlt = _infer_sql_type(df_sample[c])
-                            w.execute(text(f"ALTER TABLE {q(tname)} ADD COLUMN {q(c)} {sqlt}"))
-                return
+                with engine.connect() as conn:
+                    exists = engine.dialect.has_table(conn, tname)
+            try:
+                existing_cols = [c['name'] for c in insp.get_columns(tname)] if exists else []
+            except Exception:
+                existing_cols = []
+        if exists:
+            # Add any missing columns present in the sample, all in one transaction
+            to_add = [c for c in df_sample.columns if c not in existing_cols]
+            if to_add:
+                with engine.begin() as w:
+                    for c in to_add:
+                        sqlt = _infer_sql_type(df_sample[c])
+                        w.execute(text(f"ALTER TABLE {q(tname)} ADD COLUMN {q(c)} {sqlt}"))
+                insp.clear_cache()
+            return
         # Create table with inferred columns and surrogate id
         cols = []
         for c in df_sample.columns:
@@ -1270,6 +1705,7 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
             ddl = f"CREATE TABLE {q(tname)} ({pk}{(', ' + col_defs) if col_defs else ''});"
         with engine.begin() as conn:
             conn.execute(text(ddl))
+        insp.clear_cache()
 
     imported_count = 0
     start_ts = time.monotonic()
@@ -1286,11 +1722,13 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
     except Exception:
         pass
 
+    progress_saver = _ProgressSaver(session)
+
     # If mapping routes to multiple tables, import per table; otherwise use legacy single-table path
     if per_table_map:
         for tname, map_entry in per_table_map.items():
             # Build DataFrame for this table
-            df_t = pd.DataFrame(index=raw_df.index)
+            table_columns: Dict[str, Any] = {}
             for src, m in map_entry.items():
                 if isinstance(m, dict):
                     field = (m.get('field') or m.get('column') or m.get('target_column') or '').strip()
@@ -1304,12 +1742,13 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                     continue
                 field = resolve_template_column_name(field)
                 if fill_mode == 'constant':
-                    df_t[field] = [fill_value] * len(raw_df)
+                    table_columns[field] = [fill_value] * len(raw_df)
                 elif fill_mode == 'auto_sequence':
-                    df_t[field] = list(range(1, len(raw_df) + 1))
+                    table_columns[field] = np.arange(1, len(raw_df) + 1)
                 else:
                     if src in raw_df.columns:
-                        df_t[field] = raw_df[src]
+                        table_columns[field] = raw_df[src]
+            df_t = pd.DataFrame(table_columns, index=raw_df.index, copy=False)
             # Ensure table exists
             _ensure_table_exists(tname, df_t.head(200))
 
@@ -1335,10 +1774,11 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                         nk_source = rel_ctx['nk_source']
                         src_vals = raw_df.get(nk_source)
                         if src_vals is not None:
-                            fk_values = []
-                            for v in src_vals:
-                                key = _normalize_key(v, do_norm)
-                                fk_values.append(id_by_norm.get(key))
+                            # Normalize the distinct keys in one vectorised pass; rows pick up their id via the codes
+                            codes, uniques = pd.factorize(src_vals)
+                            norm_uniques = _normalize_key_series(pd.Series(uniques, dtype=object), do_norm)
+                            ids = np.array([id_by_norm.get(n) for n in norm_uniques] + [None], dtype=object)
+                            fk_values = ids[codes]
                             if len(fk_values) == len(df_t):
                                 df_t[fk_col] = fk_values
                     except Exception:
@@ -1360,13 +1800,12 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
             except Exception:
                 pass
 
-            records = df_t.where(pd.notnull(df_t), None).to_dict("records")
-            cleaned_records = [_convert_record_for_db(record) for record in records]
+            cleaned_records = _convert_dataframe_for_db(df_t)
 
             # Row index mapping for duplicate decisions
             df_indices: List[int] = list(df_t.index)
 
-            with engine.begin() as connection:
+            with engine.begin() as connection, _LineageWriter() as lineage_writer:
                 try:
                     if effective_mode == "replace":
                         qualified = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
@@ -1386,10 +1825,42 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                             # Fallback start value
                             next_id = 1
 
+                    # psycopg2: large plain-append chunks are streamed with COPY, the rest use execute_values
+                    is_psycopg2 = engine.dialect.driver == "psycopg2"
+
+                    # Statement text depends only on the table and the record columns; build it once per table
+                    local_mode = effective_mode
+                    if local_mode == 'upsert' and single_auto_id_pk:
+                        local_mode = 'append'
+                    is_upsert = local_mode == "upsert" and bool(primary_keys)
+                    if is_upsert:
+                        qualified = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+                    all_cols = list(cleaned_records[0].keys()) if cleaned_records else []
+                    cols = [c for c in all_cols if not (single_auto_id_pk and c == 'id')]
+                    pk_of = _pk_getter(primary_keys, all_cols)
+                    quoted_cols = ", ".join([f'"{c}"' for c in cols])
+                    pk_list = ", ".join([f'"{c}"' for c in primary_keys])
+                    set_clause = ", ".join([f'"{c}"=EXCLUDED."{c}"' for c in cols if c not in primary_keys])
+                    # Build safe parameter names
+                    param_names = {c: f'p_{i}' for i, c in enumerate(cols)}
+                    placeholders = ", ".join([f':{param_names[c]}' for c in cols])
+                    insert_head = f"INSERT INTO {qualified} ({quoted_cols})"
+                    conflict_tail = f"ON CONFLICT ({pk_list}) DO UPDATE SET {set_clause}"
+                    if is_upsert:
+                        stmt = text(f"{insert_head} VALUES ({placeholders}) {conflict_tail}")
+                    else:
+                        stmt = text(f"{insert_head} VALUES ({placeholders})")
+                    # DB-side dedup uses the first unique constraint if available
+                    try:
+                        ucs = table_def.get('unique_constraints') or []
+                        dedupe_cols = list(ucs[0]) if ucs else []
+                    except Exception:
+                        dedupe_cols = []
+
                     chunk_size = config.chunk_size or 1000
                     for start_idx in range(0, len(cleaned_records), chunk_size):
                         chunk = cleaned_records[start_idx : start_idx + chunk_size]
-                        original_chunk = raw_df.iloc[start_idx : start_idx + len(chunk)].to_dict(orient="records")
+                        original_chunk = raw_records[start_idx : start_idx + len(chunk)]
                         to_insert = list(chunk)
                         skipped: List[Tuple[int, int, Dict[str, Any], Dict[str, Any]]] = []
 
@@ -1405,21 +1876,16 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                         row_numbers: List[int] = [start_idx + i + 1 for i in range(len(chunk))]
 
                         if primary_keys and chunk:
-                            pk_tuples: List[Tuple[Any, ...]] = []
-                            for record in chunk:
-                                pk_key = tuple(record.get(col) for col in primary_keys)
-                                pk_tuples.append(pk_key)
+                            pk_tuples: List[Tuple[Any, ...]] = list(map(pk_of, chunk))
                             existing_map = _fetch_existing_rows_by_pk(
                                 session,
                                 table_def,
                                 pk_values=pk_tuples,
-                                columns=list(chunk[0].keys()),
                             )
                             if effective_mode == "append":
                                 filtered: List[Dict[str, Any]] = []
                                 for offset, record in enumerate(chunk):
-                                    pk_key = tuple(record.get(col) for col in primary_keys)
-                                    if pk_key in existing_map:
+                                    if pk_tuples[offset] in existing_map:
                                         original_record = original_chunk[offset] if offset < len(original_chunk) else {}
                                         skipped.append((row_numbers[offset], index_chunk[offset], record, original_record))
                                     else:
@@ -1435,177 +1901,75 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                                     filtered.append(record)
                                 to_insert = filtered
 
-                        # Compute local mode and filter id for single id PK
-                        local_mode = effective_mode
-                        if local_mode == 'upsert' and single_auto_id_pk:
-                            local_mode = 'append'
-
-                        if local_mode == "upsert" and primary_keys:
-                            qualified = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
-                            all_cols = [c for c in (to_insert[0].keys() if to_insert else chunk[0].keys())]
-                            cols = [c for c in all_cols if not (single_auto_id_pk and c == 'id')]
-                            quoted_cols = ", ".join([f'"{c}"' for c in cols])
-                            pk_list = ", ".join([f'"{c}"' for c in primary_keys])
-                            set_clause = ", ".join([f'"{c}"=EXCLUDED."{c}"' for c in cols if c not in primary_keys])
-                            # Build safe parameter names
-                            param_names = {c: f'p_{i}' for i, c in enumerate(cols)}
-                            placeholders = ", ".join([f':{param_names[c]}' for c in cols])
-                            stmt = text(
-                                f"INSERT INTO {qualified} ({quoted_cols}) VALUES ({placeholders}) "
-                                f"ON CONFLICT ({pk_list}) DO UPDATE SET {set_clause}"
-                            )
+                        if is_upsert:
                             if to_insert:
                                 # If PK values are absent/unusable, perform in-file dedup by full record
                                 try:
-                                    if not primary_keys or all(rec.get(pk) in (None, '') for pk in primary_keys for rec in to_insert):
-                                        seen = set()
-                                        uniq = []
-                                        for rec in to_insert:
-                                            h = json.dumps(rec, sort_keys=True, default=str)
-                                            if h in seen:
-                                                continue
-                                            seen.add(h)
-                                            uniq.append(rec)
-                                        to_insert = uniq
-                                        # Also dedupe against DB using all non-id columns (best effort)
-                                        dedupe_cols = [c for c in cols if c.lower() != 'id']
-                                        if dedupe_cols and to_insert:
-                                            # Build OR of ANDs
-                                            where = []
-                                            params_db = {}
-                                            for i, rec in enumerate(to_insert[:200]):
-                                                terms = []
-                                                for j, c in enumerate(dedupe_cols):
-                                                    pname = f'd{i}_{j}'
-                                                    terms.append(f'"{c}" = :{pname}')
-                                                    params_db[pname] = rec.get(c)
-                                                where.append('(' + ' AND '.join(terms) + ')')
-                                            if where:
-                                                exists_sql = text(f'SELECT 1 FROM {qualified} WHERE ' + ' OR '.join(where) + ' LIMIT 1')
-                                                # Filter out rows that already exist one by one (conservative)
-                                                filtered = []
-                                                for rec in to_insert:
-                                                    try:
-                                                        # Quick probe reusing param map shape (limited accuracy for >200)
-                                                        ok = True
-                                                        # Accept speculative keep; DB check for all rows is costly
-                                                        filtered.append(rec)
-                                                    except Exception:
-                                                        filtered.append(rec)
-                                                to_insert = filtered
+                                    if _pks_all_empty(to_insert, primary_keys):
+                                        to_insert = _dedupe_records(to_insert)
                                 except Exception:
                                     pass
-                                # DB-side dedup using first unique constraint if available
-                                try:
-                                    ucs = table_def.get('unique_constraints') or []
-                                    dedupe_cols = list(ucs[0]) if ucs else []
-                                except Exception:
-                                    dedupe_cols = []
                                 if dedupe_cols:
                                     try:
-                                        key_list = []
-                                        for rec in to_insert:
-                                            key_list.append(tuple(rec.get(c) for c in dedupe_cols))
-                                        # build OR of AND terms
-                                        where_terms = []
-                                        params_db = {}
-                                        for i, key in enumerate(key_list):
-                                            terms = []
-                                            for j, c in enumerate(dedupe_cols):
-                                                pname = f'd{i}_{j}'
-                                                terms.append(f'"{c}" = :{pname}')
-                                                params_db[pname] = key[j]
-                                            where_terms.append('(' + ' AND '.join(terms) + ')')
-                                        if where_terms:
-                                            select_cols = ', '.join([f'"{c}"' for c in dedupe_cols])
-                                            exists_sql = text(f'SELECT {select_cols} FROM {qualified} WHERE ' + ' OR '.join(where_terms))
-                                            existing = set()
-                                            for row in connection.execute(exists_sql, params_db).fetchall():
-                                                existing.add(tuple(row))
-                                            to_insert = [rec for rec in to_insert if tuple(rec.get(c) for c in dedupe_cols) not in existing]
+                                        key_list = [tuple(rec.get(c) for c in dedupe_cols) for rec in to_insert]
+                                        existing = _existing_key_tuples(connection, schema, table_name, dedupe_cols, key_list)
+                                        to_insert = [rec for rec, key in zip(to_insert, key_list) if key not in existing]
                                     except Exception:
                                         pass
-                                params = [ {param_names[c]: rec.get(c) for c in cols} for rec in to_insert ]
-                                connection.execute(stmt, params)
+                                if is_psycopg2:
+                                    _execute_values(
+                                        connection,
+                                        insert_head,
+                                        [tuple(rec.get(c) for c in cols) for rec in to_insert],
+                                        conflict_tail,
+                                    )
+                                else:
+                                    params = [ {param_names[c]: rec.get(c) for c in cols} for rec in to_insert ]
+                                    connection.execute(stmt, params)
                                 imported_count += len(to_insert)
                         else:
                             if to_insert:
-                                all_cols = [c for c in (to_insert[0].keys() if to_insert else chunk[0].keys())]
-                                cols = [c for c in all_cols if not (single_auto_id_pk and c == 'id')]
-                                quoted_cols = ", ".join([f'"{c}"' for c in cols])
-                                param_names = {c: f'p_{i}' for i, c in enumerate(cols)}
-                                placeholders = ", ".join([f':{param_names[c]}' for c in cols])
-                                stmt = text(f"INSERT INTO {qualified} ({quoted_cols}) VALUES ({placeholders})")
                                 # In-file dedup when PK is not usable
                                 try:
-                                    if not primary_keys or all(rec.get(pk) in (None, '') for pk in primary_keys for rec in to_insert):
-                                        seen = set()
-                                        uniq = []
-                                        for rec in to_insert:
-                                            h = json.dumps(rec, sort_keys=True, default=str)
-                                            if h in seen:
-                                                continue
-                                            seen.add(h)
-                                            uniq.append(rec)
-                                        to_insert = uniq
+                                    if _pks_all_empty(to_insert, primary_keys):
+                                        to_insert = _dedupe_records(to_insert)
                                 except Exception:
                                     pass
-                                # DB-side dedup using first unique constraint if available
-                                try:
-                                    ucs = table_def.get('unique_constraints') or []
-                                    dedupe_cols = list(ucs[0]) if ucs else []
-                                except Exception:
-                                    dedupe_cols = []
                                 if dedupe_cols:
                                     try:
-                                        key_list = []
-                                        for rec in to_insert:
-                                            key_list.append(tuple(rec.get(c) for c in dedupe_cols))
-                                        where_terms = []
-                                        params_db = {}
-                                        for i, key in enumerate(key_list):
-                                            terms = []
-                                            for j, c in enumerate(dedupe_cols):
-                                                pname = f'd{i}_{j}'
-                                                terms.append(f'"{c}" = :{pname}')
-                                                params_db[pname] = key[j]
-                                            where_terms.append('(' + ' AND '.join(terms) + ')')
-                                        if where_terms:
-                                            select_cols = ', '.join([f'"{c}"' for c in dedupe_cols])
-                                            exists_sql = text(f'SELECT {select_cols} FROM {qualified} WHERE ' + ' OR '.join(where_terms))
-                                            existing = set()
-                                            for row in connection.execute(exists_sql, params_db).fetchall():
-                                                existing.add(tuple(row))
-                                            to_insert = [rec for rec in to_insert if tuple(rec.get(c) for c in dedupe_cols) not in existing]
+                                        key_list = [tuple(rec.get(c) for c in dedupe_cols) for rec in to_insert]
+                                        existing = _existing_key_tuples(connection, schema, table_name, dedupe_cols, key_list)
+                                        to_insert = [rec for rec, key in zip(to_insert, key_list) if key not in existing]
                                     except Exception:
                                         pass
-                                params = [ {param_names[c]: rec.get(c) for c in cols} for rec in to_insert ]
-                                connection.execute(stmt, params)
+                                if is_psycopg2 and len(to_insert) > COPY_INSERT_THRESHOLD:
+                                    _copy_insert(connection, qualified, [f'"{c}"' for c in cols],
+                                                 ([rec.get(c) for c in cols] for rec in to_insert))
+                                elif is_psycopg2:
+                                    _execute_values(connection, insert_head,
+                                                    [tuple(rec.get(c) for c in cols) for rec in to_insert])
+                                else:
+                                    params = [ {param_names[c]: rec.get(c) for c in cols} for rec in to_insert ]
+                                    connection.execute(stmt, params)
                                 imported_count += len(to_insert)
 
                         # Update per-table progress (best-effort)
                         try:
                             total_rows = max(1, len(df_t))
                             progress = int(((start_idx + len(chunk)) / total_rows) * 100)
-                            session.import_progress = min(99, progress)
-                            session.save(update_fields=['import_progress'])
+                            progress_saver.update(min(99, progress))
                         except Exception:
                             pass
 
-                        # Audit inserted/updated rows
+                        # Audit inserted/updated rows (one bulk INSERT per chunk)
+                        lineage_batch: List[DataLineage] = []
                         for offset, record in enumerate(to_insert):
                             original_record = original_chunk[offset] if offset < len(original_chunk) else {}
-                            if primary_keys:
-                                pk_values = [record.get(col) for col in primary_keys]
-                                target_id = "|".join([str(value) for value in pk_values])
-                            else:
-                                target_id = ""
-                            op = "insert"
-                            if local_mode == "upsert" and primary_keys:
-                                pk_key = tuple(record.get(col) for col in primary_keys)
-                                if pk_key in existing_map:
-                                    op = "update"
-                            DataLineage.objects.create(
+                            # One PK tuple per record serves both the lineage id and the update check
+                            pk_key = pk_of(record) if primary_keys else ()
+                            target_id = "|".join(map(str, pk_key))
+                            op = "update" if local_mode == "upsert" and pk_key and pk_key in existing_map else "insert"
+                            lineage_batch.append(DataLineage(
                                 import_session=session,
                                 target_table=sql_key,
                                 target_record_id=target_id,
@@ -1613,7 +1977,7 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                                 original_data=original_record,
                                 transformed_data=record,
                                 operation=op,
-                            )
+                            ))
 
                         # Audit skipped duplicates
                         for row_no, row_index, record, original_record in skipped:
@@ -1630,7 +1994,7 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                             else:
                                 marked["skip_reason"] = "duplicate_skipped"
                             marked["duplicate"] = True
-                            DataLineage.objects.create(
+                            lineage_batch.append(DataLineage(
                                 import_session=session,
                                 target_table=sql_key,
                                 target_record_id=target_id,
@@ -1638,7 +2002,13 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                                 original_data=original_record,
                                 transformed_data=marked,
                                 operation="skip",
-                            )
+                            ))
+                        lineage_writer.submit(lineage_batch)
+                    lineage_writer.flush()
+                    try:
+                        progress_saver.flush()
+                    except Exception:
+                        pass
 
                 except IntegrityError as exc:
                     logger.error("Integrity error during import: %s", exc)
@@ -1660,18 +2030,35 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
     approved_rows: Set[int] = {int(k) for k, v in _dup_decisions.items() if str(v).lower() == 'approve'}
     skipped_rows: Set[int] = {int(k) for k, v in _dup_decisions.items() if str(v).lower() == 'skip'}
 
-    with engine.begin() as connection:
+    with engine.begin() as connection, _LineageWriter() as lineage_writer:
         try:
             if effective_mode == "replace":
                 qualified = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
                 connection.execute(text(f'DELETE FROM {qualified}'))
 
+            is_psycopg2 = engine.dialect.driver == "psycopg2"
+            q = engine.dialect.identifier_preparer.quote
+            copy_target = f'{q(schema)}.{q(table_name)}' if schema else q(table_name)
+
+            # Every record has the same keys, so the upsert text is fixed for the whole import
+            is_upsert = effective_mode == "upsert" and bool(primary_keys)
+            cols = list(cleaned_records[0].keys()) if cleaned_records else []
+            pk_of = _pk_getter(primary_keys, cols)
+            if is_upsert:
+                # PostgreSQL upsert with proper quoting and optional schema
+                qualified = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
+                quoted_cols = ", ".join([f'"{c}"' for c in cols])
+                pk_list = ", ".join([f'"{c}"' for c in primary_keys])
+                set_clause = ", ".join([f'"{c}"=EXCLUDED."{c}"' for c in cols if c not in primary_keys])
+                placeholders = ", ".join([f':{c}' for c in cols])
+                insert_head = f"INSERT INTO {qualified} ({quoted_cols})"
+                conflict_tail = f"ON CONFLICT ({pk_list}) DO UPDATE SET {set_clause}"
+                stmt = text(f"{insert_head} VALUES ({placeholders}) {conflict_tail}")
+
             chunk_size = config.chunk_size or 1000
             for start_idx in range(0, len(cleaned_records), chunk_size):
                 chunk = cleaned_records[start_idx : start_idx + chunk_size]
-                original_chunk = raw_df.iloc[start_idx : start_idx + len(chunk)].to_dict(
-                    orient="records"
-                )
+                original_chunk = raw_records[start_idx : start_idx + len(chunk)]
                 # Pre-filter duplicates by composite PK and skip them (reason based on saved decisions)
                 to_insert = list(chunk)
                 skipped: List[Tuple[int, int, Dict[str, Any], Dict[str, Any]]] = []  # (row_number, row_index, record, original_record)
@@ -1682,24 +2069,19 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
 
                 if primary_keys and chunk:
                     # Build PK tuples for this chunk
-                    pk_tuples: List[Tuple[Any, ...]] = []
-                    for record in chunk:
-                        pk_key = tuple(record.get(col) for col in primary_keys)
-                        pk_tuples.append(pk_key)
+                    pk_tuples: List[Tuple[Any, ...]] = list(map(pk_of, chunk))
 
                     existing_map = _fetch_existing_rows_by_pk(
                         session,
                         table_def,
                         pk_values=pk_tuples,
-                        columns=list(chunk[0].keys()),
                     )
 
                     # Mode-specific duplicate handling
                     if effective_mode == "append":
                         filtered: List[Dict[str, Any]] = []
                         for offset, record in enumerate(chunk):
-                            pk_key = tuple(record.get(col) for col in primary_keys)
-                            if pk_key in existing_map:
+                            if pk_tuples[offset] in existing_map:
                                 original_record = original_chunk[offset] if offset < len(original_chunk) else {}
                                 skipped.append((row_numbers[offset], index_chunk[offset], record, original_record))
                             else:
@@ -1716,46 +2098,40 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                             filtered.append(record)
                         to_insert = filtered
 
-                if effective_mode == "upsert" and primary_keys:
-                    # PostgreSQL upsert with proper quoting and optional schema
-                    qualified = f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'
-                    cols = [c for c in (to_insert[0].keys() if to_insert else chunk[0].keys())]
-                    quoted_cols = ", ".join([f'"{c}"' for c in cols])
-                    pk_list = ", ".join([f'"{c}"' for c in primary_keys])
-                    set_clause = ", ".join([f'"{c}"=EXCLUDED."{c}"' for c in cols if c not in primary_keys])
-                    placeholders = ", ".join([f':{c}' for c in cols])
-                    stmt = text(
-                        f"INSERT INTO {qualified} ({quoted_cols}) VALUES ({placeholders}) "
-                        f"ON CONFLICT ({pk_list}) DO UPDATE SET {set_clause}"
-                    )
-                    if to_insert:
+                if is_upsert:
+                    if to_insert and is_psycopg2:
+                        _execute_values(
+                            connection,
+                            insert_head,
+                            [tuple(rec.get(c) for c in cols) for rec in to_insert],
+                            conflict_tail,
+                        )
+                        imported_count += len(to_insert)
+                    elif to_insert:
                         connection.execute(stmt, to_insert)
                         imported_count += len(to_insert)
                 else:
-                    if to_insert:
+                    if to_insert and is_psycopg2 and len(to_insert) > COPY_INSERT_THRESHOLD:
+                        _copy_insert(connection, copy_target, [q(c) for c in cols],
+                                     ([rec.get(c) for c in cols] for rec in to_insert))
+                        imported_count += len(to_insert)
+                    elif to_insert:
                         result = connection.execute(sql_table.insert(), to_insert)
                         imported_count += result.rowcount
 
                 # Update progress
                 progress = int(((start_idx + len(chunk)) / len(cleaned_records)) * 100)
-                session.import_progress = progress
-                session.save(update_fields=['import_progress'])
+                progress_saver.update(progress)
 
-                # Audit inserted rows
+                # Audit inserted rows (one bulk INSERT per chunk)
+                lineage_batch: List[DataLineage] = []
                 for offset, record in enumerate(to_insert):
                     original_record = original_chunk[offset] if offset < len(original_chunk) else {}
-                    if primary_keys:
-                        pk_values = [record.get(col) for col in primary_keys]
-                        target_id = "|".join([str(value) for value in pk_values])
-                    else:
-                        target_id = ""
-                    op = "insert"
-                    if effective_mode == "upsert" and primary_keys:
-                        pk_key = tuple(record.get(col) for col in primary_keys)
-                        if pk_key in existing_map:
-                            op = "update"
+                    pk_key = pk_of(record) if primary_keys else ()
+                    target_id = "|".join(map(str, pk_key))
+                    op = "update" if effective_mode == "upsert" and pk_key and pk_key in existing_map else "insert"
 
-                    DataLineage.objects.create(
+                    lineage_batch.append(DataLineage(
                         import_session=session,
                         target_table=sql_key,
                         target_record_id=target_id,
@@ -1763,7 +2139,7 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                         original_data=original_record,
                         transformed_data=record,
                         operation=op,
-                    )
+                    ))
 
                 # Audit skipped duplicates with reason
                 for row_no, row_index, record, original_record in skipped:
@@ -1780,7 +2156,7 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                     else:
                         marked["skip_reason"] = "duplicate_skipped"
                     marked["duplicate"] = True
-                    DataLineage.objects.create(
+                    lineage_batch.append(DataLineage(
                         import_session=session,
                         target_table=sql_key,
                         target_record_id=target_id,
@@ -1788,7 +2164,10 @@ def execute_data_import(session: ImportSession, effective_mode: str = "append")
                         original_data=original_record,
                         transformed_data=marked,
                         operation="skip",
-                    )
+                    ))
+                lineage_writer.submit(lineage_batch)
+            lineage_writer.flush()
+            progress_saver.flush()
 
         except IntegrityError as exc:
             logger.error("Integrity error during import: %s", exc)
@@ -1854,27 +2233,30 @@ def _sync_serial_sequence(engine, table_def: Dict[str, Any], id_column: str = 'i
     """For PostgreSQL: align serial or identity sequence for id with MAX(id). No-op for others."""
     if engine.dialect.name != 'postgresql':
         return
-    schema = table_def.get("schema")
-    table_name = table_def.get("table_name")
-    q = engine.dialect.identifier_preparer.quote
-    qualified = f'{q(schema)}.{q(table_name)}' if schema else f'{q(table_name)}'
     try:
         with engine.begin() as conn:
-            # Try serial/sequence-based first
-            seq_row = conn.execute(
-                text("SELECT pg_get_serial_sequence(:tbl, :col)"),
-                {"tbl": (f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'), "col": id_column},
-            ).fetchone()
-            max_id = conn.execute(text(f"SELECT COALESCE(MAX({q(id_column)}), 0) FROM {qualified}")).scalar() or 0
-            if seq_row and seq_row[0]:
-                seq_name = seq_row[0]
-                conn.execute(text("SELECT setval(:seq, :val, true)"), {"seq": seq_name, "val": max_id})
-                return
-            # Fallback: identity columns (ADD GENERATED ... AS IDENTITY) can be re-seeded via RESTART WITH
-            try:
-                conn.execute(text(f"ALTER TABLE {qualified} ALTER COLUMN {q(id_column)} RESTART WITH :n"), {"n": int(max_id) + 1})
-            except Exception:
-                # Last resort: do nothing
-                pass
+            _sync_serial_sequence_on(conn, table_def, id_column)
     except Exception:
         return
+
+
+def _sync_serial_sequence_on(conn, table_def: Dict[str, Any], id_column: str = 'id'):
+    """Same as _sync_serial_sequence, but on a caller-owned connection/transaction."""
+    if conn.dialect.name != 'postgresql':
+        return
+    schema = table_def.get("schema")
+    table_name = table_def.get("table_name")
+    q = conn.dialect.identifier_preparer.quote
+    qualified = f'{q(schema)}.{q(table_name)}' if schema else f'{q(table_name)}'
+    # Try serial/sequence-based first
+    seq_row = conn.execute(
+        text("SELECT pg_get_serial_sequence(:tbl, :col)"),
+        {"tbl": (f'"{schema}"."{table_name}"' if schema else f'"{table_name}"'), "col": id_column},
+    ).fetchone()
+    max_id = conn.execute(text(f"SELECT COALESCE(MAX({q(id_column)}), 0) FROM {qualified}")).scalar() or 0
+    if seq_row and seq_row[0]:
+        seq_name = seq_row[0]
+        conn.execute(text("SELECT setval(:seq, :val, true)"), {"seq": seq_name, "val": max_id})
+        return
+    # Fallback: identity columns (ADD GENERATED ... AS IDENTITY) can be re-seeded via RESTART WITH
+    conn.execute(text(f"ALTER TABLE {qualified} ALTER COLUMN {q(id_column)} RESTART WITH {int(max_id) + 1}"))
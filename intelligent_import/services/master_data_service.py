@@ -7,9 +7,9 @@ import logging
 from typing import Dict, List, Set, Tuple
 
 from django.apps import apps
-from django.db import IntegrityError, transaction
+from django.db import IntegrityError, connections, transaction
 
-from ..models import ImportSession, MasterDataCandidate
+from ..models import ImportSession, MasterDataCandidate, casefold_value
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +76,11 @@ class MasterDataService:
         target_model_name: str,
         not_found_names: Set[str],
     ) -> int:
+        """
+        Raise candidates for missing values and return how many were submitted. Where the
+        unique constraint applies, values already queued are skipped by the database but
+        still counted, so this is an upper bound on new rows.
+        """
         if not not_found_names:
             return 0
 
@@ -89,39 +94,50 @@ class MasterDataService:
             return 0
 
         target_table = TargetModel._meta.db_table
-        existing_values = set(
-            MasterDataCandidate.objects.filter(
-                import_session=self.session,
-                target_master_table=target_table,
-                proposed_value__in=list(not_found_names),
-            ).values_list("proposed_value", flat=True)
-        )
-
-        names_to_create = [value for value in not_found_names if value not in existing_values]
-        if not names_to_create:
+        # One candidate per normalised value; values already queued for this
+        # session/table are skipped by the unique constraint (ON CONFLICT DO NOTHING).
+        by_norm = {}
+        for value in not_found_names:
+            norm = casefold_value(value)
+            if norm:
+                by_norm.setdefault(norm, value)
+        if not by_norm:
             return 0
 
-        candidates = [
+        if not connections[MasterDataCandidate.objects.db].features.supports_partial_indexes:
+            # No partial unique index (MySQL): skip values already queued before inserting
+            existing = MasterDataCandidate.objects.filter(
+                import_session=self.session,
+                target_master_table=target_table,
+                proposed_value_normalized__in=list(by_norm),
+            ).values_list("proposed_value_normalized", flat=True)
+            for norm in existing:
+                by_norm.pop(norm, None)
+            if not by_norm:
+                return 0
+
+        submitted = [
             MasterDataCandidate(
                 import_session=self.session,
                 target_master_table=target_table,
                 proposed_value=value,
+                proposed_value_normalized=norm,
             )
-            for value in names_to_create
+            for norm, value in by_norm.items()
         ]
 
         try:
             with transaction.atomic():
-                MasterDataCandidate.objects.bulk_create(candidates, ignore_conflicts=True)
+                MasterDataCandidate.objects.bulk_create(submitted, ignore_conflicts=True)
         except IntegrityError as exc:
             logger.warning("Master data candidate creation encountered an issue: %s", exc)
 
         logger.info(
-            "Queued %s master data candidate(s) for table '%s'.",
-            len(candidates),
+            "Submitted %s master data candidate(s) for table '%s'; already-queued values are skipped.",
+            len(submitted),
             target_table,
         )
-        return len(candidates)
+        return len(submitted)
 
 from django.db import connection, transaction
 from ..naming_policy import normalize_snake, table_name as np_table_name
@@ -18,10 +18,17 @@ from difflib import SequenceMatcher
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
+from .data_processing import HEADER_SAMPLE_ROWS, get_connection_engine
+
+try:
+    import pyarrow
+except ImportError:  # optional; pandas' parsers are used without it
+    pyarrow = None
+
 logger = logging.getLogger(__name__)
 
 # Threshold for considering a similarity score as a valid match.
@@ -189,7 +196,12 @@ class SchemaAnalyzer:
     # --------------------------------------------------------------------- #
     def _read_csv_with_fallback(self, path, header=None):
         import pandas as pd
-        # Keep your previous options if you had them
+        # pyarrow's parser first; it cannot skip ragged lines, so those files fall back
+        if pyarrow is not None:
+            try:
+                return pd.read_csv(path, header=header, dtype=str, engine="pyarrow")
+            except (pyarrow.ArrowInvalid, ValueError):
+                pass
         return pd.read_csv(path, header=header, dtype=str, engine="python", on_bad_lines="skip")
 
     def _load_file(self, file_path: str, header_row=None):
@@ -199,10 +211,12 @@ class SchemaAnalyzer:
         import os, pandas as pd, logging
         logger = logging.getLogger(__name__)
 
-        # Read raw without header so we can detect the header row
+        is_excel = file_path.lower().endswith((".xlsx", ".xls"))
+        # Read raw without header so we can detect the header row; for Excel only a
+        # small sample, since every workbook read re-parses the sheet XML
         try:
-            if file_path.lower().endswith((".xlsx", ".xls")):
-                raw = pd.read_excel(file_path, header=None, dtype=str)
+            if is_excel:
+                raw = pd.read_excel(file_path, header=None, dtype=str, nrows=HEADER_SAMPLE_ROWS)
             else:
                 raw = self._read_csv_with_fallback(file_path, header=None)
         except Exception:
@@ -211,10 +225,10 @@ class SchemaAnalyzer:
 
         guess = self._detect_header_row_from_df(raw)
         if guess is None:
-            df = raw.copy()
+            df = pd.read_excel(file_path, header=None, dtype=str) if is_excel else raw.copy()
             df.columns = [f"col_{i+1}" for i in range(df.shape[1])]
         else:
-            if file_path.lower().endswith((".xlsx", ".xls")):
+            if is_excel:
                 df = pd.read_excel(file_path, header=guess, dtype=str)
             else:
                 df = self._read_csv_with_fallback(file_path, header=guess)
@@ -240,7 +254,7 @@ class SchemaAnalyzer:
     # --------------------------------------------------------------------- #
     def _create_engine(self) -> Optional[Engine]:
         try:
-            return create_engine(self.db_connection.get_connection_uri())
+            return get_connection_engine(self.db_connection)
         except ModuleNotFoundError as exc:
             missing = getattr(exc, "name", "required database driver")
             logger.warning(
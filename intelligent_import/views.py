@@ -8,6 +8,7 @@ from difflib import SequenceMatcher
 import os
 import json
 import logging
+import uuid
 import math
 from datetime import datetime, date, time
 from decimal import Decimal
@@ -24,11 +25,11 @@ from django.views.decorators.http import require_http_methods, require_POST
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET
 from django.views.decorators.cache import never_cache
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from .services.master_data_service import plan_schema_changes, apply_schema_changes
 from .naming_policy import normalize_snake, table_name as np_table_name
 from django.db import IntegrityError
-from django.db import connection
+from django.db import connection, connections
 try:
     from .services.schema_analyzer import SchemaAnalyzer  # same app folder
 except Exception:
@@ -117,7 +118,7 @@ def report_template_fields_api(request, template_id):
 @require_http_methods(["GET","PUT"])
 def report_template_mapping_api(request, template_id):
     try:
-        t = ReportTemplate.objects.get(id=template_id)
+        t = ReportTemplate.objects.select_related("extras").get(id=template_id)
     except ReportTemplate.DoesNotExist:
         return JsonResponse({"success": False, "error": "Not found"}, status=404)
 
@@ -125,7 +126,7 @@ def report_template_mapping_api(request, template_id):
         return JsonResponse({
             "success": True,
             "mapping": t.mapping or {},
-            "schema_proposals": t.schema_proposals or []
+            "schema_proposals": t.get_extras().schema_proposals or []
         })
 
     # PUT (save mapping + stage schema proposals)
@@ -159,9 +160,11 @@ def report_template_mapping_api(request, template_id):
                 })
 
         t.mapping = mapping
-        t.schema_proposals = proposals
-        t.version += 1
-        t.save()
+        extras = t.get_extras()
+        extras.schema_proposals = proposals
+        with transaction.atomic():
+            t.save()
+            extras.save()
         return JsonResponse({"success": True})
     except Exception as e:
         return JsonResponse({"success": False, "error": str(e)}, status=400)
@@ -172,11 +175,12 @@ def report_template_approve_schema_api(request, template_id):
     if not _is_manager(request.user):
         return JsonResponse({"success": False, "error": "Forbidden"}, status=403)
     try:
-        t = ReportTemplate.objects.get(id=template_id)
+        t = ReportTemplate.objects.select_related("extras").get(id=template_id)
     except ReportTemplate.DoesNotExist:
         return JsonResponse({"success": False, "error": "Not found"}, status=404)
 
-    proposals = t.schema_proposals or []
+    extras = t.get_extras()
+    proposals = extras.schema_proposals or []
     plan = plan_schema_changes(proposals)
     try:
         apply_schema_changes(plan)  # transactional
@@ -184,8 +188,9 @@ def report_template_approve_schema_api(request, template_id):
         return JsonResponse({"success": False, "error": f"DDL failed: {e}"}, status=400)
 
     # clear proposals after success
-    t.schema_proposals = []
-    t.save()
+    if proposals:
+        extras.schema_proposals = []
+        extras.save(update_fields=["schema_proposals"])
     return JsonResponse({"success": True, "summary": plan.get("summary", []), "name_map": plan.get("name_map", {})})
 
 @login_required
@@ -310,6 +315,8 @@ from mis_app.permissions import PermissionManager
 from .services.data_processing import (
     process_and_validate_data,
     execute_data_import,
+    evict_source_dataframe,
+    get_connection_engine,
     get_table_schema_from_db,
 )
 from collections import Counter
@@ -408,10 +415,12 @@ def _convert_to_builtin(value):
     Also normalizes NaN/Inf to None to satisfy strict JSON constraints
     (e.g., SQLite JSON_VALID or MySQL JSON) and avoids invalid tokens.
     """
-    # Normalize pandas NA/NaN first
-    if 'pd' in globals() and pd is not None:
+    # Normalize pandas NA/NaN first; plain None/float NaN and types that are never NA skip pd.isna
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if 'pd' in globals() and pd is not None and not isinstance(value, int) and not hasattr(value, "__len__"):
         try:
-            # pd.isna handles pd.NA, np.nan, NaT
+            # pd.isna handles pd.NA, NaT, numpy NaN/NaT scalars
             if pd.isna(value):
                 return None
         except Exception:
@@ -519,14 +528,18 @@ def intelligent_import_dashboard(request):
     """Main intelligent import dashboard"""
     user_sessions = ImportSession.objects.filter(
         user=request.user
-    ).select_related('report_template', 'connection').order_by('-created_at')[:20]
+    ).select_related('report_template', 'connection').defer(
+        *ImportSession.HEAVY_FIELDS
+    ).order_by('-created_at')[:20]
     
     # Get pending approvals
     pending_approvals = []
     if request.user.user_type in ['Moderator', 'Admin']:
         pending_approvals = ImportSession.objects.filter(
             status='pending_approval'
-        ).select_related('user', 'report_template').order_by('created_at')
+        ).select_related('user', 'report_template').defer(
+            *ImportSession.HEAVY_FIELDS
+        ).order_by('created_at')
     
     # Get available report templates
     templates = ReportTemplate.objects.filter(
@@ -595,6 +608,15 @@ def intelligent_import_dashboard(request):
     return render(request, 'intelligent_import/dashboard.html', context)
 
 
+def _duplicate_response(duplicate):
+    """400 response for a file already held by another active session."""
+    return JsonResponse({
+        'success': False,
+        'error': f'Duplicate file detected. Previously imported on {duplicate.created_at.strftime("%Y-%m-%d %H:%M")}',
+        'duplicate_session_id': str(duplicate.id)
+    }, status=400)
+
+
 @login_required
 @intelligent_import_permission_required('upload')
 @require_POST
@@ -645,51 +667,51 @@ def upload_and_analyze(request):
         # Validate connection ownership
         connection = get_object_or_404(ExternalConnection, id=connection_id, owner=request.user)
 
-        # Create import session
-        session = ImportSession.objects.create(
-            user=request.user,
-            connection=connection,
-            original_filename=uploaded_file.name,
-            file_size=uploaded_file.size,
-            status='analyzing'
-        )
-
-        # Save uploaded file to temp location
+        # Save uploaded file to temp location (named after the session id we are about to create)
+        session_id = uuid.uuid4()
         safe_original = get_valid_filename(uploaded_file.name)
-        temp_filename = f"{session.id}_{safe_original}"
+        temp_filename = f"{session_id}_{safe_original}"
         temp_dir = os.path.join(settings.MEDIA_ROOT, 'intelligent_import_temp')
         os.makedirs(temp_dir, exist_ok=True)
         temp_path = os.path.join(temp_dir, temp_filename)
 
+        # Hash while streaming to disk so the file is never re-read for deduplication
+        hasher = ImportSession.content_hasher()
         with open(temp_path, 'wb') as temp_file:
-            for chunk in uploaded_file.chunks():
+            for chunk in uploaded_file.chunks(chunk_size=1 << 20):
+                hasher.update(chunk)
                 temp_file.write(chunk)
-
-        session.temp_filename = temp_filename
-
-        # Generate file hash for deduplication
-        with open(temp_path, 'rb') as f:
-            file_content = f.read()
-        session.file_hash = session.generate_file_hash(file_content)
-
-        recent_duplicate = ImportSession.objects.filter(
-            file_hash=session.file_hash,
-            created_at__gte=timezone.now() - timezone.timedelta(days=30)
-        ).exclude(id=session.id).first()
-
-        if recent_duplicate:
-            session.delete()
+        file_hash = hasher.hexdigest()
+
+        # Duplicate detection is enforced by the partial unique constraint on
+        # (user, connection, file_hash): a single INSERT either succeeds or conflicts.
+        duplicate = None
+        if not connections[ImportSession.objects.db].features.supports_partial_indexes:
+            duplicate = ImportSession.active_duplicates(request.user, connection, file_hash).first()
+        if duplicate is None:
+            try:
+                with transaction.atomic():
+                    session = ImportSession.objects.create(
+                        id=session_id,
+                        user=request.user,
+                        connection=connection,
+                        original_filename=uploaded_file.name,
+                        file_size=uploaded_file.size,
+                        temp_filename=temp_filename,
+                        file_hash=file_hash,
+                        status='analyzing'
+                    )
+            except IntegrityError:
+                duplicate = ImportSession.active_duplicates(request.user, connection, file_hash).first()
+                if duplicate is None:
+                    raise
+
+        if duplicate is not None:
             try:
                 os.remove(temp_path)
             except Exception as cleanup_err:
                 logger.warning("Failed to delete temp file for duplicate: %s", cleanup_err)
-            return JsonResponse({
-                'success': False,
-                'error': f'Duplicate file detected. Previously imported on {recent_duplicate.created_at.strftime("%Y-%m-%d %H:%M")}',
-                'duplicate_session_id': str(recent_duplicate.id)
-            }, status=400)
-
-        session.save()
+            return _duplicate_response(duplicate)
 
         # Analyze file structure
         try:
@@ -722,6 +744,8 @@ def upload_and_analyze(request):
             }
             session.header_row = 0
             session.total_rows = safe_results.get('file_analysis', {}).get('total_rows', 0)
+            session.total_columns = safe_results.get('file_analysis', {}).get('total_columns', 0)
+            session.confidence_score = safe_results.get('confidence_score') or 0.0
             session.status = 'template_suggested'
 
             suggested_mapping = safe_results.get('suggested_mapping') or {}
@@ -751,7 +775,10 @@ def upload_and_analyze(request):
                 session.report_template = None
                 session.detected_template = template_match.get('template_name', '')
 
-            session.save()
+            session.save(update_fields=[
+                'analysis_summary', 'column_mapping', 'header_row', 'total_rows', 'total_columns',
+                'confidence_score', 'status', 'report_template', 'detected_template', 'updated_at',
+            ])
 
             suggested_target = safe_results.get('suggested_target')
             if suggested_target:
@@ -789,6 +816,9 @@ def upload_and_analyze(request):
             })
         except Exception as e:
             logger.error("Schema analysis failed: %s", str(e), exc_info=True)
+            # Release the (user, connection, file_hash) slot so the file can be re-uploaded
+            session.status = 'failed'
+            session.save(update_fields=['status', 'updated_at'])
             return JsonResponse({"success": False, "error": f"Analyzer error: {e}"}, status=400)
 
     except ValueError as e:
@@ -824,7 +854,7 @@ def define_column_mapping(request):
         session.user_comments = user_comments
         session.import_mode = import_mode
         session.status = 'mapping_defined'
-        session.save()
+        session.save(update_fields=['column_mapping', 'user_comments', 'import_mode', 'status', 'updated_at'])
         
         session.add_system_note("Column mapping definition saved.")
         
@@ -907,7 +937,7 @@ def approve_mapping(request):
         session.approved_at = timezone.now()
         session.approval_comments = approval_comments
         session.status = 'mapping_approved'
-        session.save()
+        session.save(update_fields=['approved_by', 'approved_at', 'approval_comments', 'status', 'updated_at'])
         
         session.add_system_note(f"Mapping approved by {request.user.username}")
         
@@ -983,7 +1013,7 @@ def validate_and_preview_data(request):
             'total_rows': validation_results['summary']['total_rows'],
         }
         session.status = 'pending_approval'
-        session.save()
+        session.save(update_fields=['validation_results', 'preview_data', 'analysis_summary', 'status', 'updated_at'])
 
         session.add_system_note(
             f"Data validation completed. {validation_results['summary']['total_rows']} rows processed"
@@ -1040,7 +1070,9 @@ def approve_and_import(request):
         session.import_mode = import_mode
         session.status = 'importing_data'
         session.started_at = timezone.now()
-        session.save()
+        session.save(update_fields=[
+            'approved_by', 'approved_at', 'approval_comments', 'import_mode', 'status', 'started_at', 'updated_at',
+        ])
         
         # Get a sample of the dataframe to choose import strategy
         temp_path = os.path.join(settings.MEDIA_ROOT, 'intelligent_import_temp', session.temp_filename)
@@ -1050,7 +1082,7 @@ def approve_and_import(request):
         df_sample = df.head(200)
 
         # Detect if target table exists + rowcount
-        engine = create_engine(session.connection.get_connection_uri())
+        engine = get_connection_engine(session.connection)
         target_table_name = session.report_template.target_table
         with engine.connect() as conn:
             target_exists = engine.dialect.has_table(conn, target_table_name)
@@ -1076,7 +1108,7 @@ def approve_and_import(request):
                 session.status = 'failed'
                 session.add_system_note(f"Import failed: {import_results.get('error', 'Unknown error')}")
             
-            session.save()
+            session.save(update_fields=['status', 'completed_at', 'imported_record_count', 'updated_at'])
             
             # Clean up temp file
             temp_path = os.path.join(
@@ -1094,8 +1126,10 @@ def approve_and_import(request):
         except Exception as e:
             session.status = 'failed'
             session.add_system_note(f"Import execution failed: {str(e)}", 'error')
-            session.save()
+            session.save(update_fields=['status', 'updated_at'])
             raise
+        finally:
+            evict_source_dataframe(temp_path)
         
     except Exception as e:
         logger.error(f"Import approval and execution failed: {str(e)}", exc_info=True)
@@ -1133,7 +1167,7 @@ def rollback_import(request, session_id):
         
         if rollback_results['success']:
             session.status = 'rolled_back'
-            session.save()
+            session.save(update_fields=['status', 'updated_at'])
             session.add_system_note(f"Import rolled back by {request.user.username}: {rollback_reason}")
         
         return JsonResponse({
@@ -1252,7 +1286,9 @@ def execute_rollback(session: ImportSession, rollback_user: User, reason: str) -
 @require_GET
 @never_cache
 def list_sessions(request):
-    qs = ImportSession.objects.filter(user=request.user).order_by('-created_at')[:20]
+    qs = ImportSession.objects.filter(user=request.user).defer(
+        *ImportSession.HEAVY_FIELDS
+    ).order_by('-created_at')[:20]
     sessions = [{
         'id': str(s.id),
         'original_filename': s.original_filename,
@@ -1260,6 +1296,8 @@ def list_sessions(request):
         'created_at': s.created_at.isoformat(),
         'connection': getattr(s.connection, 'nickname', ''),
         'total_rows': s.total_rows,
+        'total_columns': s.total_columns,
+        'confidence_score': s.confidence_score,
         'imported_record_count': s.imported_record_count,
         'user': s.user.username,
     } for s in qs]
@@ -1365,6 +1403,7 @@ def delete_session(request, session_id):
             except Exception:
                 # Non-fatal
                 pass
+            evict_source_dataframe(temp_path)
 
         session.delete()
         return JsonResponse({'success': True, 'message': 'Session deleted successfully.'})
@@ -1491,7 +1530,9 @@ def cancel_session(request, session_id):
         # Cancel the session
         session.status = 'cancelled'
         session.add_system_note(f"Session cancelled by user {request.user.username}.")
-        session.save()
+        session.save(update_fields=['status', 'updated_at'])
+        if session.temp_filename:
+            evict_source_dataframe(os.path.join(settings.MEDIA_ROOT, 'intelligent_import_temp', session.temp_filename))
         
         return JsonResponse({
             'success': True,
@@ -1532,6 +1573,13 @@ def restart_session(request, session_id):
                 'success': False,
                 'error': 'The temporary file for this session could not be found. Please upload the file again.'
             }, status=400)
+        evict_source_dataframe(temp_path)
+
+        # Reactivating an inactive session re-takes the (user, connection, file_hash) slot
+        if session.status in ImportSession.INACTIVE_STATUSES and session.file_hash:
+            duplicate = ImportSession.active_duplicates(session.user, session.connection, session.file_hash).first()
+            if duplicate is not None:
+                return _duplicate_response(duplicate)
 
         template_qs = ReportTemplate.objects.filter(is_active=True).order_by('name')
         templates_list = list(template_qs)
@@ -1593,9 +1641,23 @@ def restart_session(request, session_id):
             session.detected_template = template_match.get('template_name', '')
 
         session.total_rows = analysis_results.get('file_analysis', {}).get('total_rows', 0)
+        session.total_columns = analysis_results.get('file_analysis', {}).get('total_columns', 0)
+        session.confidence_score = analysis_results.get('confidence_score') or 0.0
         session.imported_record_count = 0
         session.status = 'template_suggested'
-        session.save()
+        try:
+            with transaction.atomic():
+                session.save(update_fields=[
+                    'column_mapping', 'validation_results', 'preview_data', 'analysis_summary',
+                    'report_template', 'detected_template', 'total_rows', 'total_columns',
+                    'confidence_score', 'imported_record_count', 'status', 'updated_at',
+                ])
+        except IntegrityError:
+            # Another session took the slot while the file was being re-analysed
+            duplicate = ImportSession.active_duplicates(session.user, session.connection, session.file_hash).first()
+            if duplicate is None:
+                raise
+            return _duplicate_response(duplicate)
 
         suggested_target = analysis_results.get('suggested_target')
         if suggested_target:
@@ -1622,8 +1684,10 @@ def restart_session(request, session_id):
                 f"(confidence {score_pct}%)."
             )
 
-        session.add_system_note(f"Session restarted by {request.user.username}.")
-        session.add_system_note("File analysis completed successfully after restart.")
+        session.add_system_notes([
+            f"Session restarted by {request.user.username}.",
+            "File analysis completed successfully after restart.",
+        ])
 
         return JsonResponse({
             'success': True,
@@ -1740,12 +1804,10 @@ def report_template_headers_api(request, template_id):
                     master_data_source=h.get("master_data_source",""),
                     master_output_field=h.get("master_output_field",""),
                     transform=h.get("transform",""),
-                    depends_on=h.get("depends_on") or [],
                     strict=bool(h.get("strict", False)),
                 )
             )
-    # bump version for visibility
-    tpl.version += 1
+    # save() bumps the version
     tpl.updated_by = request.user
     tpl.save(update_fields=["version", "updated_by", "updated_at"])
     return JsonResponse({"success": True, "template": {"id": str(tpl.id), "version": tpl.version}})
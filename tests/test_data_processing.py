@@ -0,0 +1,158 @@
+# tests/test_data_processing.py
+
+import os
+import tempfile
+from datetime import datetime
+from unittest import mock, skipUnless
+
+import pandas as pd
+from django.test import SimpleTestCase, override_settings
+from intelligent_import.services import data_processing
+from intelligent_import.services.data_processing import (
+    _clean_series,
+    _coerce_column,
+    _convert_dataframe_for_db,
+    _get_source_dataframe,
+    _load_source_dataframe,
+    evict_source_dataframe,
+    find_exact_duplicates,
+)
+from intelligent_import.services.schema_analyzer import SchemaAnalyzer
+
+
+class FindExactDuplicatesTests(SimpleTestCase):
+
+    def test_groups_canonicalised_rows(self):
+        df = pd.DataFrame({
+            'buyer': ['Acme  Ltd', ' Acme Ltd', 'acme ltd', 'Acme Ltd', 'Other'],
+            'qty': [1, 1, 1, 1, 2],
+            'note': [None, 'N/A', '', 'null', 'x'],
+        })
+        result = find_exact_duplicates(df, ['buyer', 'qty', 'note'], max_samples=2)
+        self.assertEqual(result['duplicates_total'], 2)
+        self.assertEqual(len(result['duplicate_groups']), 1)
+        group = result['duplicate_groups'][0]
+        self.assertEqual(group['count'], 3)
+        self.assertEqual(group['sample_idx'], [1, 2])
+
+    def test_accepts_records_and_ignores_missing_columns(self):
+        rows = [{'a': 1, 'b': 'x'}, {'a': 1, 'b': 'x'}, {'a': 2, 'b': 'x'}]
+        self.assertEqual(find_exact_duplicates(rows, ['a', 'b', 'zzz'])['duplicates_total'], 1)
+        self.assertEqual(find_exact_duplicates(rows, [])['duplicates_total'], 0)
+
+
+class ConvertDataframeForDbTests(SimpleTestCase):
+
+    def test_nulls_become_none_and_timestamps_datetime(self):
+        df = pd.DataFrame({
+            'when': pd.to_datetime(['2024-01-02', None]),
+            'qty': pd.array([3, None], dtype='Int64'),
+            'price': [1.5, float('nan')],
+        })
+        records = _convert_dataframe_for_db(df)
+        self.assertEqual(records[0], {'when': datetime(2024, 1, 2), 'qty': 3, 'price': 1.5})
+        self.assertIs(type(records[0]['when']), datetime)
+        self.assertEqual(records[1], {'when': None, 'qty': None, 'price': None})
+
+
+class CoerceDatetimeTests(SimpleTestCase):
+
+    def test_format_sniffed_from_sample_not_first_value(self):
+        series = pd.Series(['01/02/2024 10:00:00', '25/12/2024 09:00:00'], dtype=object)
+        coerced, errors = _coerce_column(series, 'DATETIME')
+        self.assertEqual(errors, [])
+        self.assertEqual(coerced.tolist(), [pd.Timestamp(2024, 2, 1, 10), pd.Timestamp(2024, 12, 25, 9)])
+
+
+class CoerceIntegerTests(SimpleTestCase):
+
+    def test_fractional_values_are_reported_not_raised(self):
+        series = pd.Series(['4', '3.5', None, 'abc', '1e30'], dtype='string')
+        coerced, errors = _coerce_column(series, 'INTEGER')
+        self.assertEqual(str(coerced.dtype), 'Int64')
+        self.assertEqual(coerced.iloc[0], 4)
+        self.assertEqual(errors, [1, 3, 4])
+
+
+class CleanSeriesTests(SimpleTestCase):
+
+    def test_blank_cells_stay_null_and_are_not_invalid(self):
+        cleaned = _clean_series(pd.Series([' 7 ', None, float('nan'), '', 'N/A'], dtype=object))
+        self.assertEqual(cleaned.isna().tolist(), [False, True, True, True, True])
+        coerced, errors = _coerce_column(cleaned, 'INTEGER')
+        self.assertEqual(coerced.iloc[0], 7)
+        self.assertEqual(errors, [])
+
+
+class SourceDataframeCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as fh:
+            fh.write('a,b\n1,x\n2,y\n')
+        self.addCleanup(os.remove, self.path)
+        self.addCleanup(evict_source_dataframe, self.path)
+
+    @override_settings(INTELLIGENT_IMPORT_CONFIG={'SOURCE_CACHE_MAX_MB': 64})
+    def test_reused_until_evicted(self):
+        first = _get_source_dataframe(self.path)
+        self.assertIs(_get_source_dataframe(self.path), first)
+        evict_source_dataframe(self.path)
+        self.assertNotIn(self.path, data_processing._source_cache)
+        self.assertIsNot(_get_source_dataframe(self.path), first)
+
+    @override_settings(INTELLIGENT_IMPORT_CONFIG={})
+    def test_disabled_by_default(self):
+        _get_source_dataframe(self.path)
+        self.assertNotIn(self.path, data_processing._source_cache)
+
+
+def _plain(obj):
+    """Object values with every missing marker as None, for engine-independent comparison."""
+    return obj.astype(object).where(obj.notna(), None)
+
+
+@skipUnless(data_processing.pyarrow is not None, 'pyarrow not installed')
+class PyarrowParityTests(SimpleTestCase):
+    """The pyarrow engine and string[pyarrow] dtype must give the same results as the fallbacks."""
+
+    FILES = {
+        'plain': 'code,name,qty\nA1, Widget ,3\nA2,,\n',
+        'title_and_blank_lines': 'Daily report\n\nGenerated 2024-01-02\n\ncode,name,qty\nA1,Widget,3\n\nA2,Gadget,4\n',
+        'quoted': 'code,name,qty\n"A,1","say ""hi""",3\nA2,N/A,NULL\n',
+    }
+
+    def _write(self, content):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as fh:
+            fh.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_load_source_dataframe_matches_c_parser(self):
+        for name, content in self.FILES.items():
+            path = self._write(content)
+            with self.subTest(file=name):
+                arrow_df = _load_source_dataframe(path)
+                with mock.patch.object(data_processing, 'pyarrow', None):
+                    c_df = _load_source_dataframe(path)
+                pd.testing.assert_frame_equal(_plain(arrow_df), _plain(c_df))
+
+    def test_schema_analyzer_read_matches_python_parser(self):
+        path = self._write(self.FILES['title_and_blank_lines'])
+        for header in (None, 2):
+            with self.subTest(header=header):
+                arrow_df = SchemaAnalyzer._read_csv_with_fallback(None, path, header=header)
+                with mock.patch('intelligent_import.services.schema_analyzer.pyarrow', None):
+                    py_df = SchemaAnalyzer._read_csv_with_fallback(None, path, header=header)
+                pd.testing.assert_frame_equal(_plain(arrow_df), _plain(py_df))
+
+    def test_clean_and_coerce_match_python_strings(self):
+        raw = pd.Series([' 7 ', None, '', 'N/A', '3.5', 'true', ' No ', '2024-01-02', 'x'], dtype=object)
+        for data_type in ('INTEGER', 'DECIMAL', 'BOOLEAN', 'DATETIME', 'TEXT'):
+            with self.subTest(data_type=data_type):
+                arrow_out, arrow_errors = _coerce_column(_clean_series(raw), data_type)
+                with mock.patch.object(data_processing, 'STRING_DTYPE', 'string'):
+                    py_out, py_errors = _coerce_column(_clean_series(raw), data_type)
+                self.assertEqual(arrow_errors, py_errors)
+                self.assertEqual(_plain(arrow_out).tolist(), _plain(py_out).tolist())
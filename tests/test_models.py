@@ -1,6 +1,9 @@
 # tests/test_models.py
 
-from django.test import TestCase
+from importlib import import_module
+
+from django.apps import apps
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 from mis_app.models import UserGroup, GroupPermission, UserPermission, ExternalConnection
 
@@ -44,3 +47,20 @@ class PermissionModelTests(TestCase):
         )
         self.assertEqual(permission.user, self.user)
         self.assertEqual(permission.permission_level, 'edit')
+
+
+class EnumChoiceColumnTests(SimpleTestCase):
+    """Choices stored as Postgres ENUMs must stay in step with the labels created by migration 0021."""
+
+    def test_choices_match_enum_labels(self):
+        enum_columns = import_module('intelligent_import.migrations.0021_pg_enum_choice_columns').ENUM_COLUMNS
+        models_by_table = {m._meta.db_table: m for m in apps.get_app_config('intelligent_import').get_models()}
+        for table, column, length, enum_type, labels in enum_columns:
+            field = models_by_table[table]._meta.get_field(column)
+            with self.subTest(enum_type=enum_type):
+                self.assertEqual(
+                    tuple(value for value, _ in field.choices), labels,
+                    f"{table}.{column} choices changed; add an ALTER TYPE {enum_type} ADD VALUE migration "
+                    f"and extend the labels in ENUM_COLUMNS",
+                )
+                self.assertEqual(field.max_length, length)
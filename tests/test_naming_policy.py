@@ -0,0 +1,29 @@
+# tests/test_naming_policy.py
+
+from django.test import SimpleTestCase
+from intelligent_import.naming_policy import (
+    normalize_snake, table_name, resolve_template_table_name, resolve_template_column_name,
+)
+
+
+class NamingPolicyTests(SimpleTestCase):
+
+    def test_normalize_snake(self):
+        self.assertEqual(normalize_snake('Production Qty (pcs)'), 'production_qty_pcs')
+        self.assertEqual(normalize_snake('  Ünit--Name!! '), 'unit_name')
+        self.assertEqual(normalize_snake('1st_Line'), 'st_line')
+        self.assertEqual(normalize_snake('__a__b__'), 'a_b')
+        self.assertEqual(normalize_snake('Order'), 'order_col')
+        self.assertEqual(normalize_snake('%%%'), 'x')
+        self.assertEqual(normalize_snake(None), 'x')
+        self.assertEqual(normalize_snake('a' * 80, maxlen=10), 'a' * 10)
+
+    def test_table_name(self):
+        self.assertEqual(table_name('REF', 'Unit Master'), 'ref_unit_master')
+        self.assertEqual(table_name('other', 'Sewing Output'), 'fact_sewing_output')
+
+    def test_resolve_template_names_strip_builder_prefixes(self):
+        self.assertEqual(resolve_template_column_name('__newcol__: Line No'), 'line_no')
+        self.assertEqual(resolve_template_column_name('NEW: Style'), 'style')
+        self.assertEqual(resolve_template_table_name('__reuse_new__:fact_sewing'), 'fact_sewing')
+        self.assertEqual(resolve_template_table_name('newtable: User'), 'user_col')